@@ -0,0 +1,395 @@
+"""
+Kernels compilados com Numba para operações sobre conjuntos de bits
+
+Este módulo concentra as rotinas de baixo nível chamadas com alta frequência
+pelos algoritmos (validação de cliques, coloração do CliSAT e construção
+do GRASP sobre a matriz de adjacência empacotada em palavras uint64).
+
+O Numba é opcional: sem ele, NUMBA_AVAILABLE é False e os chamadores devem
+usar seus caminhos em Python puro. A validação também tem uma versão em
+Cython (validate_clique_c), disponível quando CYTHON_AVAILABLE é True.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba não instalado
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Substituto de numba.njit que apenas devolve a função original."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+try:
+    # Extensão Cython opcional (algorithms/_validate.pyx), quando compilada
+    from ._validate import validate_clique_c
+    CYTHON_AVAILABLE = True
+except ImportError:
+    validate_clique_c = None
+    CYTHON_AVAILABLE = False
+
+
+@njit(boundscheck=False, cache=True)
+def validate_clique_bits(clique_idx, adj_bits):
+    """
+    Verificar se os vértices formam um clique usando a matriz de bits.
+
+    Args:
+        clique_idx: Vetor de índices dos vértices
+        adj_bits: Matriz uint64 (n x palavras) com as vizinhanças empacotadas
+
+    Returns:
+        True se todos os pares de vértices são adjacentes
+    """
+    k = clique_idx.shape[0]
+    for i in range(k):
+        row = adj_bits[clique_idx[i]]
+        for j in range(i + 1, k):
+            b = clique_idx[j]
+            if (row[b >> 6] >> np.uint64(b & 63)) & np.uint64(1) == 0:
+                return False
+    return True
+
+
+@njit(cache=True)
+def _popcount64(x):
+    """Contar os bits ligados de uma palavra uint64 (SWAR)."""
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+@njit(inline='always', boundscheck=False)
+def _independent(class_words, adj_row, n_words):
+    """Testar se a classe é disjunta de N(v), parando na primeira interseção."""
+    for wi in range(n_words):
+        if class_words[wi] & adj_row[wi]:
+            return False
+    return True
+
+
+@njit(inline='always', boundscheck=False)
+def _iseq_impl(adj_words, cand_words, k, n_words):
+    """Corpo do ISEQ; n_words constante permite desenrolar os laços de palavras."""
+    uncolored = cand_words.copy()
+    class_words = np.zeros(n_words, dtype=np.uint64)
+    colors_flat = np.empty(n_words * 64, dtype=np.int32)
+    class_starts = np.empty(k + 1, dtype=np.int32)
+    zero = np.uint64(0)
+    one = np.uint64(1)
+
+    pos = 0
+    n_classes = 0
+    while n_classes < k:
+        remaining = False
+        for wi in range(n_words):
+            if uncolored[wi] != zero:
+                remaining = True
+                break
+        if not remaining:
+            break
+
+        class_starts[n_classes] = pos
+        class_words[:] = zero
+        for wi in range(n_words):
+            word = uncolored[wi]
+            while word != zero:
+                low = word & (~word + one)
+                word ^= low
+                v = wi * 64 + np.int64(_popcount64(low - one))
+
+                if _independent(class_words, adj_words[v], n_words):
+                    class_words[wi] |= low
+                    colors_flat[pos] = v
+                    pos += 1
+
+        for wi in range(n_words):
+            uncolored[wi] &= ~class_words[wi]
+        n_classes += 1
+
+    class_starts[n_classes] = pos
+    return colors_flat[:pos], class_starts[:n_classes + 1]
+
+
+@njit(inline='always', boundscheck=False)
+def _is_k_colorable_impl(adj_words, cand_words, k, n_words):
+    """Corpo do teste de k-colorabilidade; ver _iseq_impl."""
+    uncolored = cand_words.copy()
+    class_words = np.zeros(n_words, dtype=np.uint64)
+    zero = np.uint64(0)
+    one = np.uint64(1)
+
+    for _ in range(k):
+        remaining = False
+        for wi in range(n_words):
+            if uncolored[wi] != zero:
+                remaining = True
+                break
+        if not remaining:
+            return True
+
+        class_words[:] = zero
+        for wi in range(n_words):
+            word = uncolored[wi]
+            while word != zero:
+                low = word & (~word + one)
+                word ^= low
+                v = wi * 64 + np.int64(_popcount64(low - one))
+
+                if _independent(class_words, adj_words[v], n_words):
+                    class_words[wi] |= low
+
+        for wi in range(n_words):
+            uncolored[wi] &= ~class_words[wi]
+
+    for wi in range(n_words):
+        if uncolored[wi] != zero:
+            return False
+    return True
+
+
+@njit(cache=True, boundscheck=False)
+def iseq_bitset(adj_words, cand_words, k):
+    """
+    ISEQ (coloração sequencial gulosa) sobre conjuntos de bits.
+
+    Cada classe percorre os candidatos ainda não coloridos em ordem crescente
+    de índice e aceita o vértice se ele não é vizinho de nenhum membro.
+
+    Args:
+        adj_words: Matriz uint64 (n x palavras) com as vizinhanças empacotadas
+        cand_words: Vetor uint64 (palavras) com os vértices a colorir
+        k: Número máximo de classes
+
+    Returns:
+        Tupla (colors_flat, class_starts): vértices coloridos, classe após
+        classe, e o início de cada classe em colors_flat (mais o fim da última)
+    """
+    return _iseq_impl(adj_words, cand_words, k, cand_words.shape[0])
+
+
+@njit(cache=True, boundscheck=False)
+def is_k_colorable(adj_words, cand_words, k):
+    """
+    Verificar se o ISEQ colore todos os candidatos com no máximo k classes.
+
+    Interrompe assim que os candidatos se esgotam ou a k-ésima classe é
+    formada, sem registrar as classes.
+
+    Args:
+        adj_words: Matriz uint64 (n x palavras) com as vizinhanças empacotadas
+        cand_words: Vetor uint64 (palavras) com os vértices a colorir
+        k: Número máximo de classes
+
+    Returns:
+        True se nenhum candidato fica sem cor após k classes
+    """
+    return _is_k_colorable_impl(adj_words, cand_words, k, cand_words.shape[0])
+
+
+# Números de palavras com kernels especializados (n até 1024 vértices)
+SPECIALIZED_WORD_COUNTS = (1, 2, 4, 8, 16)
+
+# Kernels especializados já compilados, por número de palavras
+_SPECIALIZED_KERNELS = {}
+
+
+def padded_word_count(n: int) -> int:
+    """
+    Número de palavras uint64 para n vértices, arredondado para o menor
+    tamanho com kernels especializados (acima de 16, o valor exato).
+    """
+    n_words = (n + 63) >> 6
+    for size in SPECIALIZED_WORD_COUNTS:
+        if n_words <= size:
+            return size
+    return n_words
+
+
+def make_bitset_kernels(n_words: int):
+    """
+    Obter kernels (iseq, is_k_colorable) para vetores de n_words palavras.
+
+    Para os tamanhos em SPECIALIZED_WORD_COUNTS, n_words entra no kernel
+    como constante de compilação, o que permite ao LLVM desenrolar e
+    vetorizar os laços de palavras; os demais tamanhos usam os kernels
+    genéricos.
+
+    Args:
+        n_words: Número de palavras dos vetores de bits
+
+    Returns:
+        Tupla (iseq, is_k_colorable) com as assinaturas de iseq_bitset e
+        is_k_colorable
+    """
+    if not NUMBA_AVAILABLE or n_words not in SPECIALIZED_WORD_COUNTS:
+        return iseq_bitset, is_k_colorable
+
+    kernels = _SPECIALIZED_KERNELS.get(n_words)
+    if kernels is None:
+        words = n_words
+
+        @njit(cache=True, boundscheck=False)
+        def iseq_fixed(adj_words, cand_words, k):
+            return _iseq_impl(adj_words, cand_words, k, words)
+
+        @njit(cache=True, boundscheck=False)
+        def is_k_colorable_fixed(adj_words, cand_words, k):
+            return _is_k_colorable_impl(adj_words, cand_words, k, words)
+
+        kernels = _SPECIALIZED_KERNELS[n_words] = (iseq_fixed, is_k_colorable_fixed)
+    return kernels
+
+
+@njit(inline='always', boundscheck=False)
+def _masked_degree(adj_row, mask_words, n_words):
+    """Contar os vizinhos de um vértice dentro de uma máscara de palavras."""
+    degree = 0
+    for wi in range(n_words):
+        degree += _popcount64(adj_row[wi] & mask_words[wi])
+    return degree
+
+
+@njit(cache=True, boundscheck=False)
+def grasp_construction(adj_words, degrees_full, alpha, draws, work):
+    """
+    Construção gulosa randomizada do GRASP sobre conjuntos de bits.
+
+    A cada passo, os candidatos (adjacentes a todo o clique parcial) são
+    pontuados pelo grau entre si; a RCL reúne os de grau pelo menos
+    min + alpha * (max - min) e draws[passo] escolhe um deles. No primeiro
+    passo todos os vértices são candidatos e os graus vêm de degrees_full.
+
+    Args:
+        adj_words: Matriz uint64 (n x palavras) com as vizinhanças empacotadas
+        degrees_full: Vetor com o grau de cada vértice no grafo
+        alpha: Parâmetro de aleatoriedade do GRASP
+        draws: Vetor de uniformes em [0, 1), um por passo (tamanho >= n)
+        work: Matriz int32 (3 x n) de trabalho, reaproveitada entre chamadas
+
+    Returns:
+        Vetor int32 com os índices do clique construído, na ordem de
+        inserção (uma vista de work[0])
+    """
+    n = adj_words.shape[0]
+    n_words = adj_words.shape[1]
+    one = np.uint64(1)
+
+    cand = np.zeros(n_words, dtype=np.uint64)
+    for v in range(n):
+        cand[v >> 6] |= one << np.uint64(v & 63)
+
+    clique = work[0]
+    cand_idx = work[1]
+    degrees = work[2]
+    size = 0
+
+    while True:
+        m = 0
+        for wi in range(n_words):
+            word = cand[wi]
+            while word != 0:
+                low = word & (~word + one)
+                word ^= low
+                v = wi * 64 + np.int64(_popcount64(low - one))
+                cand_idx[m] = v
+                if size == 0:
+                    degrees[m] = degrees_full[v]
+                else:
+                    degrees[m] = _masked_degree(adj_words[v], cand, n_words)
+                m += 1
+        if m == 0:
+            break
+
+        best_value = degrees[0]
+        worst_value = degrees[0]
+        for i in range(1, m):
+            best_value = max(best_value, degrees[i])
+            worst_value = min(worst_value, degrees[i])
+        threshold = worst_value + alpha * (best_value - worst_value)
+
+        rcl_size = 0
+        for i in range(m):
+            if degrees[i] >= threshold:
+                rcl_size += 1
+        target = min(int(draws[size] * rcl_size), rcl_size - 1)
+
+        selected = -1
+        for i in range(m):
+            if degrees[i] >= threshold:
+                if target == 0:
+                    selected = cand_idx[i]
+                    break
+                target -= 1
+
+        clique[size] = selected
+        size += 1
+        for wi in range(n_words):
+            cand[wi] &= adj_words[selected, wi]
+
+    return clique[:size]
+
+
+@njit(cache=True, boundscheck=False)
+def greedy_expansion_bits(adj_words, degrees_full, clique_idx, out):
+    """
+    Expandir um clique adicionando, enquanto houver, o candidato viável de
+    maior grau entre os vértices fora do clique (empates: menor índice).
+
+    Um candidato viável é vizinho de todo o clique, então seu grau fora do
+    clique é o grau no grafo menos o tamanho do clique: a comparação usa
+    degrees_full diretamente.
+
+    Args:
+        adj_words: Matriz uint64 (n x palavras) com as vizinhanças empacotadas
+        degrees_full: Vetor com o grau de cada vértice no grafo
+        clique_idx: Vetor de índices do clique inicial
+        out: Vetor int32 (n) de saída, reaproveitado entre chamadas
+
+    Returns:
+        Vetor int32 com o clique inicial seguido dos vértices adicionados
+        (uma vista de out)
+    """
+    n = adj_words.shape[0]
+    n_words = adj_words.shape[1]
+    one = np.uint64(1)
+
+    feasible = np.zeros(n_words, dtype=np.uint64)
+    for v in range(n):
+        feasible[v >> 6] |= one << np.uint64(v & 63)
+
+    clique = out
+    size = 0
+    for v in clique_idx:
+        clique[size] = v
+        size += 1
+        for wi in range(n_words):
+            feasible[wi] &= adj_words[v, wi]
+
+    while True:
+        best = -1
+        best_degree = -1
+        for wi in range(n_words):
+            word = feasible[wi]
+            while word != 0:
+                low = word & (~word + one)
+                word ^= low
+                v = wi * 64 + np.int64(_popcount64(low - one))
+                if degrees_full[v] > best_degree:
+                    best_degree = degrees_full[v]
+                    best = v
+        if best < 0:
+            break
+
+        clique[size] = best
+        size += 1
+        for wi in range(n_words):
+            feasible[wi] &= adj_words[best, wi]
+
+    return clique[:size]
@@ -0,0 +1,48 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Validação de cliques em C sobre a matriz de adjacência empacotada
+
+Versão compilada de _fast.validate_clique_bits, sem o custo de chamada do
+Numba. A extensão é opcional; para compilá-la no próprio diretório:
+
+    cythonize -i -3 algorithms/_validate.pyx
+
+Sem o módulo compilado, AlgorithmInterface usa o kernel Numba ou o caminho
+NumPy.
+"""
+
+from libc.stdint cimport uint64_t
+from cython cimport Py_ssize_t
+
+
+cdef inline bint _validate(const uint64_t* adj_bits, Py_ssize_t words,
+                           const Py_ssize_t* clique, Py_ssize_t k) nogil:
+    cdef Py_ssize_t i, j, b
+    cdef const uint64_t* row
+    for i in range(k):
+        row = adj_bits + clique[i] * words
+        for j in range(i + 1, k):
+            b = clique[j]
+            if not (row[b >> 6] >> (b & 63)) & 1:
+                return False
+    return True
+
+
+def validate_clique_c(const uint64_t[:, ::1] adj_bits, const Py_ssize_t[::1] clique):
+    """
+    Verificar se os vértices formam um clique usando a matriz de bits.
+
+    Args:
+        adj_bits: Matriz uint64 C-contígua (n x palavras) com as vizinhanças
+        clique: Vetor intp C-contíguo de índices dos vértices
+
+    Returns:
+        True se todos os pares de vértices são adjacentes
+    """
+    cdef Py_ssize_t k = clique.shape[0]
+    if k <= 1:
+        return True
+    cdef bint ok
+    with nogil:
+        ok = _validate(&adj_bits[0, 0], adj_bits.shape[1], &clique[0], k)
+    return ok
@@ -6,35 +6,213 @@ a comunicação entre diferentes algoritmos de clique máximo.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+from typing import List, Tuple, Optional, Dict, Any, Callable, Union
 import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
 import time
+import hashlib
 import logging
+import weakref
+
+from . import _fast
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _pack_adjacency_bits(adj, n: int) -> np.ndarray:
+    """
+    Empacotar uma matriz de adjacência esparsa em linhas de bits.
+    
+    Args:
+        adj: Matriz de adjacência esparsa (n x n)
+        n: Número de vértices
+        
+    Returns:
+        Matriz uint64 (n x ceil(n/64)); o bit j da linha i indica a aresta (i, j)
+    """
+    words = (n + 63) // 64
+    bits = np.zeros((n, words), dtype=np.uint64)
+    coo = adj.tocoo()
+    rows = coo.row.astype(np.intp)
+    cols = coo.col.astype(np.uint64)
+    np.bitwise_or.at(bits, (rows, (cols >> np.uint64(6)).astype(np.intp)),
+                     np.uint64(1) << (cols & np.uint64(63)))
+    return bits
+
+
+@dataclass(frozen=True)
+class GraphData:
+    """
+    Estruturas indexadas derivadas de um grafo NetworkX.
+    
+    Os índices seguem a ordem de graph.nodes(). Os arranjos são
+    compartilhados entre os algoritmos criados sobre o mesmo grafo e não
+    devem ser modificados.
+    """
+    nodes: List[Any]                     # Vértice original de cada índice
+    node_index: Dict[Any, int]           # Vértice original -> índice
+    node_set: frozenset                  # Conjunto dos vértices
+    adj: Any                             # Matriz de adjacência CSR (bool)
+    adj_bits: np.ndarray                 # Vizinhanças empacotadas (uint64)
+    indptr: np.ndarray                   # Ponteiros CSR (intp, n+1)
+    indices: np.ndarray                  # Vizinhos CSR (int32, 2m)
+
+
+# Cache das estruturas por grafo; a entrada some junto com o grafo e é
+# descartada se a ordem dos vértices ou as listas de vizinhos mudaram desde
+# o cálculo (qualquer aresta trocada altera o resumo das listas)
+_GRAPH_DATA_CACHE: "weakref.WeakKeyDictionary[nx.Graph, Tuple[bytes, GraphData]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def precompute_graph_data(graph: nx.Graph) -> GraphData:
+    """
+    Obter as estruturas indexadas do grafo, calculando-as uma única vez.
+    
+    Algoritmos executados em sequência sobre o mesmo grafo (por exemplo,
+    CliSAT e GRASP na comparação) reaproveitam a matriz CSR e a matriz de
+    bits (O(n²/64) palavras); as listas de vizinhos são relidas a cada
+    chamada para detectar alterações no grafo.
+    
+    Args:
+        graph: Grafo NetworkX
+        
+    Returns:
+        GraphData do grafo
+    """
+    nodes = list(graph.nodes())
+    n = len(nodes)
+    node_index = {node: i for i, node in enumerate(nodes)}
+    
+    # CSR montada direto do dicionário de adjacência (nx.to_scipy_sparse_array
+    # passa por uma lista de arestas e custa ~15x mais em grafos densos)
+    graph_adj = graph._adj
+    indptr = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(np.fromiter((len(graph_adj[u]) for u in nodes), dtype=np.intp, count=n),
+              out=indptr[1:])
+    indices = np.fromiter((node_index[v] for u in nodes for v in graph_adj[u]),
+                          dtype=np.int32, count=int(indptr[-1]))
+    
+    signature = hashlib.blake2b(indptr.tobytes() + indices.tobytes()).digest()
+    cached = _GRAPH_DATA_CACHE.get(graph)
+    if cached is not None and cached[0] == signature and cached[1].nodes == nodes:
+        return cached[1]
+    
+    adj = sparse.csr_array((np.ones(len(indices), dtype=np.bool_), indices, indptr),
+                           shape=(n, n))
+    adj.sort_indices()
+    
+    data = GraphData(
+        nodes=nodes,
+        node_index=node_index,
+        node_set=frozenset(nodes),
+        adj=adj,
+        adj_bits=_pack_adjacency_bits(adj, n),
+        indptr=adj.indptr.astype(np.intp, copy=False),
+        indices=adj.indices.astype(np.int32, copy=False),
+    )
+    _GRAPH_DATA_CACHE[graph] = (signature, data)
+    return data
+
+
+# Informações adicionais vazias compartilhadas pelos resultados de AlgorithmResult.quick
+_EMPTY_INFO = MappingProxyType({})
+
+_INT32_INFO = np.iinfo(np.int32)
+
+
+def _as_clique_array(clique) -> Union[np.ndarray, List[Any]]:
+    """
+    Converter um clique em vetor int32 ordenado somente leitura.
+    
+    Rótulos que não são inteiros dentro da faixa int32 (strings, floats,
+    inteiros grandes) não cabem no vetor; nesse caso o clique fica como lista.
+    
+    Args:
+        clique: Vértices do clique (sequência ou vetor)
+        
+    Returns:
+        Vetor int32 ordenado ou lista com os vértices originais
+    """
+    if isinstance(clique, np.ndarray):
+        return clique
+    clique = list(clique)
+    if not all(isinstance(v, (int, np.integer)) and _INT32_INFO.min <= v <= _INT32_INFO.max
+               for v in clique):
+        return clique
+    array = np.asarray(sorted(clique), dtype=np.int32)
+    # Somente leitura: resultado pode ser compartilhado entre threads
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(slots=True, eq=False)
 class AlgorithmResult:
     """
     Resultado padrão de um algoritmo de clique máximo.
+    
+    Usa __slots__ para reduzir a memória por instância quando muitos
+    resultados intermediários são armazenados. Cliques de rótulos inteiros
+    são guardados como vetor int32 ordenado, permitindo comparar resultados
+    com np.isin, np.intersect1d e np.array_equal; outros rótulos ficam em lista.
     """
-    clique: List[int]                    # Vértices do clique encontrado
+    clique: Union[np.ndarray, List[Any]]  # Vértices do clique (int32 ordenados ou lista)
     clique_size: int                     # Tamanho do clique
     execution_time: float                # Tempo de execução em segundos
     algorithm_name: str                  # Nome do algoritmo utilizado
     is_optimal: bool = False             # Se é garantidamente ótimo
     iterations: Optional[int] = None     # Número de iterações (se aplicável)
-    additional_info: Dict[str, Any] = None  # Informações adicionais
+    additional_info: Dict[str, Any] = field(default_factory=dict)  # Informações adicionais
     
     def __post_init__(self):
-        if self.additional_info is None:
-            self.additional_info = {}
+        self.clique = _as_clique_array(self.clique)
         
         # Validar consistência
-        if len(self.clique) != self.clique_size:
-            self.clique_size = len(self.clique)
+        if self.clique_size != len(self.clique):
+            raise ValueError(f"clique_size ({self.clique_size}) difere do número de "
+                             f"vértices do clique ({len(self.clique)})")
+    
+    @classmethod
+    def quick(cls, clique, algorithm_name: str, execution_time: float,
+              iterations: Optional[int] = None) -> "AlgorithmResult":
+        """
+        Construir um resultado intermediário sem passar pelo __init__ gerado.
+        
+        Destinado a laços que registram muitos resultados (ex.: reinícios do
+        GRASP). additional_info é um mapeamento vazio somente leitura
+        compartilhado; para anotar o resultado, atribua um novo dicionário.
+        
+        Args:
+            clique: Vértices do clique (sequência ou vetor int32 ordenado)
+            algorithm_name: Nome do algoritmo
+            execution_time: Tempo de execução em segundos
+            iterations: Número de iterações (se aplicável)
+            
+        Returns:
+            AlgorithmResult não ótimo
+        """
+        clique = _as_clique_array(clique)
+        obj = cls.__new__(cls)
+        obj.clique = clique
+        obj.clique_size = len(clique)
+        obj.execution_time = execution_time
+        obj.algorithm_name = algorithm_name
+        obj.is_optimal = False
+        obj.iterations = iterations
+        obj.additional_info = _EMPTY_INFO
+        return obj
+    
+    @property
+    def clique_list(self) -> List[Any]:
+        """Vértices do clique como lista de objetos Python."""
+        if isinstance(self.clique, np.ndarray):
+            return self.clique.tolist()
+        return list(self.clique)
 
 
 class AlgorithmInterface(ABC):
@@ -44,6 +222,9 @@ class AlgorithmInterface(ABC):
     Define o padrão comum que todos os algoritmos devem seguir.
     """
     
+    # Tamanho mínimo de clique para usar o kernel compilado na validação
+    FAST_VALIDATION_MIN_SIZE = 8
+    
     def __init__(self, graph: nx.Graph, **kwargs):
         """
         Inicializar algoritmo.
@@ -53,8 +234,26 @@ class AlgorithmInterface(ABC):
             **kwargs: Parâmetros específicos do algoritmo
         """
         self.graph = graph
-        self.n_nodes = len(graph.nodes())
-        self.n_edges = len(graph.edges())
+        self.n_nodes = graph.number_of_nodes()
+        self.n_edges = graph.number_of_edges()
+        
+        # Estruturas indexadas, compartilhadas com outros algoritmos do mesmo grafo
+        data = precompute_graph_data(graph)
+        self._node_set = data.node_set
+        
+        # Matriz de adjacência esparsa (CSR) para validação vetorizada
+        self._nodes = data.nodes
+        self._node_index = data.node_index
+        self._adj = data.adj
+        
+        # Vizinhanças empacotadas em bits (64 vértices por palavra) para
+        # interseções P ∩ N(v) com np.bitwise_and nas subclasses
+        self._adj_bits = data.adj_bits
+        
+        # Listas de vizinhos em layout CSR (SoA): vizinhos de v são a fatia
+        # contígua _indices[_indptr[v]:_indptr[v + 1]], ordenada por índice
+        self._indptr = data.indptr
+        self._indices = data.indices
         
     @abstractmethod
     def solve(self) -> AlgorithmResult:
@@ -88,37 +287,184 @@ class AlgorithmInterface(ABC):
         Returns:
             True se é um clique válido, False caso contrário
         """
-        if len(clique) <= 1:
+        k = len(clique)
+        if k <= 1:
+            return True
+        
+        # Cliques pequenos: uma busca no dicionário de vizinhos por par,
+        # já verificando a existência de cada vértice (sem custo de NumPy)
+        if k < self.FAST_VALIDATION_MIN_SIZE:
+            adj = self.graph._adj
+            for i in range(k):
+                nbrs_i = adj.get(clique[i])
+                if nbrs_i is None:
+                    return False
+                for j in range(i + 1, k):
+                    if clique[j] not in nbrs_i:
+                        return False
             return True
         
         # Verificar se todos os vértices existem no grafo
-        for vertex in clique:
-            if vertex not in self.graph:
+        if not self._node_set.issuperset(clique):
+            return False
+        
+        ix = np.fromiter((self._node_index[v] for v in clique),
+                         dtype=np.intp, count=k)
+        
+        # Caminhos compilados: testes de bit diretamente na matriz empacotada
+        if _fast.CYTHON_AVAILABLE and k >= self.FAST_VALIDATION_MIN_SIZE:
+            return bool(_fast.validate_clique_c(self._adj_bits, ix))
+        if _fast.NUMBA_AVAILABLE and k >= self.FAST_VALIDATION_MIN_SIZE:
+            return bool(_fast.validate_clique_bits(ix, self._adj_bits))
+        
+        # Submatriz induzida deve ser completa fora da diagonal
+        sub = self._adj[ix][:, ix].toarray()
+        np.fill_diagonal(sub, True)
+        return bool(sub.all())
+    
+    def neighbors_mask(self, v_idx: int) -> np.ndarray:
+        """
+        Obter a vizinhança de um vértice como vetor de bits.
+        
+        Args:
+            v_idx: Índice do vértice (posição em self._nodes)
+            
+        Returns:
+            Linha uint64 da matriz de bits (visão, não deve ser modificada)
+        """
+        return self._adj_bits[v_idx]
+    
+    def clique_mask(self, clique: List[int]) -> np.ndarray:
+        """
+        Empacotar um conjunto de vértices em um vetor de bits.
+        
+        Args:
+            clique: Lista de vértices (todos existentes no grafo)
+            
+        Returns:
+            Vetor uint64 com ceil(n/64) palavras, no formato de neighbors_mask
+        """
+        mask = np.zeros(self._adj_bits.shape[1], dtype=np.uint64)
+        ix = np.fromiter((self._node_index[v] for v in clique),
+                         dtype=np.uint64, count=len(clique))
+        np.bitwise_or.at(mask, (ix >> np.uint64(6)).astype(np.intp),
+                         np.uint64(1) << (ix & np.uint64(63)))
+        return mask
+    
+    def can_extend(self, clique: Union[List[int], np.ndarray], v: Any) -> bool:
+        """
+        Verificar se o vértice v é adjacente a todos os vértices do clique.
+        
+        Custa O(n/64) palavras, em vez de revalidar o clique aumentado com
+        validate_clique (O(k²)). Em laços que testam vários candidatos para
+        o mesmo clique, passe a máscara obtida uma vez com clique_mask.
+        
+        Args:
+            clique: Lista de vértices do clique ou sua máscara (uint64)
+            v: Vértice candidato
+            
+        Returns:
+            True se clique ∪ {v} é um clique
+        """
+        v_idx = self._node_index.get(v)
+        if v_idx is None:
+            return False
+        
+        if not (isinstance(clique, np.ndarray) and clique.dtype == np.uint64):
+            if not self._node_set.issuperset(clique):
                 return False
+            clique = self.clique_mask(clique)
         
-        # Verificar se todos os pares são adjacentes
-        for i in range(len(clique)):
-            for j in range(i + 1, len(clique)):
-                if not self.graph.has_edge(clique[i], clique[j]):
-                    return False
+        return bool(np.array_equal(self._adj_bits[v_idx] & clique, clique))
+    
+    def neighbors(self, v_idx: int) -> np.ndarray:
+        """
+        Obter os vizinhos de um vértice como fatia do arranjo CSR.
         
-        return True
+        Args:
+            v_idx: Índice do vértice (posição em self._nodes)
+            
+        Returns:
+            Índices int32 dos vizinhos em ordem crescente (visão, não deve
+            ser modificada)
+        """
+        return self._indices[self._indptr[v_idx]:self._indptr[v_idx + 1]]
     
-    def get_graph_info(self) -> Dict[str, Any]:
+    @cached_property
+    def _is_connected(self) -> bool:
+        """Conectividade do grafo (calculada uma única vez sobre a CSR)."""
+        if self.n_nodes == 0:
+            raise nx.NetworkXPointlessConcept("Connectivity is undefined for the null graph.")
+        n_components = csgraph.connected_components(self._adj, directed=False,
+                                                    return_labels=False)
+        return n_components == 1
+    
+    @cached_property
+    def _diameter(self) -> Optional[int]:
+        """Diâmetro do grafo, ou None se desconexo."""
+        if not self._is_connected:
+            return None
+        return nx.diameter(self.graph)
+    
+    @cached_property
+    def _avg_clustering(self) -> float:
+        """Coeficiente de clustering médio (calculado uma única vez)."""
+        return nx.average_clustering(self.graph)
+    
+    def _density(self) -> float:
+        """Densidade a partir das contagens (equivalente a nx.density)."""
+        if self.n_nodes <= 1:
+            return 0
+        return 2 * self.n_edges / (self.n_nodes * (self.n_nodes - 1))
+    
+    def get_graph_info(self, include_expensive: bool = False) -> Dict[str, Any]:
         """
         Obter informações básicas do grafo.
         
+        As métricas caras são calculadas na primeira solicitação e
+        reaproveitadas nas seguintes.
+        
+        Args:
+            include_expensive: Incluir diâmetro (O(n·(n+m))) e clustering
+                médio (O(n·d²)), que nenhum algoritmo usa em suas decisões
+        
         Returns:
             Dicionário com informações do grafo
         """
-        return {
+        info = {
             'nodes': self.n_nodes,
             'edges': self.n_edges,
-            'density': nx.density(self.graph),
-            'is_connected': nx.is_connected(self.graph),
-            'diameter': nx.diameter(self.graph) if nx.is_connected(self.graph) else None,
-            'average_clustering': nx.average_clustering(self.graph)
+            'density': self._density(),
+            'is_connected': self._is_connected,
         }
+        
+        if include_expensive:
+            info['diameter'] = self._diameter
+            info['average_clustering'] = self._avg_clustering
+        
+        return info
+
+
+# Módulos dos algoritmos, importados sob demanda uma única vez por processo
+# (importação no topo criaria ciclo com algorithms/__init__.py)
+_CLISAT_MODULE = None
+_GRASP_MODULE = None
+
+
+def _get_clisat_module():
+    """Obter o módulo do CliSAT, importando-o na primeira chamada."""
+    global _CLISAT_MODULE
+    if _CLISAT_MODULE is None:
+        from . import clisat_exact as _CLISAT_MODULE
+    return _CLISAT_MODULE
+
+
+def _get_grasp_module():
+    """Obter o módulo do GRASP, importando-o na primeira chamada."""
+    global _GRASP_MODULE
+    if _GRASP_MODULE is None:
+        from . import grasp_heuristic as _GRASP_MODULE
+    return _GRASP_MODULE
 
 
 # Funções de conveniência para compatibilidade
@@ -136,9 +482,7 @@ def solve_maximum_clique_clisat(graph: nx.Graph,
     Returns:
         Tupla (clique, tamanho, tempo)
     """
-    from .clisat_exact import CliSAT
-    
-    solver = CliSAT(graph, time_limit=time_limit, **kwargs)
+    solver = _get_clisat_module().CliSAT(graph, time_limit=time_limit, **kwargs)
     result = solver.solve()
     
     return result
@@ -167,9 +511,7 @@ def solve_maximum_clique_heuristic(graph: nx.Graph,
         Tupla (clique, tamanho, tempo, stats_dict)
         stats_dict contém timeout_estimate se aplicável
     """
-    from .grasp_heuristic import solve_maximum_clique_grasp
-    
-    return solve_maximum_clique_grasp(
+    return _get_grasp_module().solve_maximum_clique_grasp(
         graph=graph,
         alpha=alpha,
         max_iterations=max_iterations,
@@ -200,9 +542,7 @@ def solve_maximum_clique_heuristic_with_stats(graph: nx.Graph,
         Tupla (clique, tamanho, tempo, stats_dict)
         stats_dict sempre incluído, com timeout_estimate se aplicável
     """
-    from .grasp_heuristic import solve_maximum_clique_grasp
-    
-    clique, size, time_exec, stats = solve_maximum_clique_grasp(
+    clique, size, time_exec, stats = _get_grasp_module().solve_maximum_clique_grasp(
         graph=graph,
         alpha=alpha,
         max_iterations=max_iterations,
@@ -219,12 +559,41 @@ def solve_maximum_clique_heuristic_with_stats(graph: nx.Graph,
 
 
 # Função factory para criar algoritmos
+def _make_clisat(graph: nx.Graph, **params):
+    """Criar uma instância do CliSAT."""
+    return _get_clisat_module().CliSAT(graph, **params)
+
+
+def _make_grasp(graph: nx.Graph, **params):
+    """Criar uma instância do GRASP."""
+    return _get_grasp_module().GRASPMaximumClique(graph, **params)
+
+
+# Registro de algoritmos: nome (minúsculo) -> fábrica(graph, **params)
+_ALGORITHMS: Dict[str, Callable[..., Any]] = {
+    'clisat': _make_clisat,
+    'grasp': _make_grasp,
+}
+
+
+def register_algorithm(name: str, factory: Callable[..., Any]) -> None:
+    """
+    Registrar um novo algoritmo na factory.
+    
+    Args:
+        name: Nome do algoritmo (comparado sem diferenciar maiúsculas)
+        factory: Função factory(graph, **params) que cria a instância
+    """
+    _ALGORITHMS[name.lower()] = factory
+
+
 def create_algorithm(algorithm_type: str, graph: nx.Graph, **params) -> AlgorithmInterface:
     """
     Factory para criar instâncias de algoritmos.
     
     Args:
-        algorithm_type: Tipo do algoritmo ('clisat', 'grasp')
+        algorithm_type: Tipo do algoritmo ('clisat', 'grasp' ou registrado
+            com register_algorithm)
         graph: Grafo NetworkX
         **params: Parâmetros específicos do algoritmo
         
@@ -234,11 +603,8 @@ def create_algorithm(algorithm_type: str, graph: nx.Graph, **params) -> Algorith
     Raises:
         ValueError: Se o tipo de algoritmo não é suportado
     """
-    if algorithm_type.lower() == 'clisat':
-        from .clisat_exact import CliSAT
-        return CliSAT(graph, **params)
-    elif algorithm_type.lower() == 'grasp':
-        from .grasp_heuristic import GRASPMaximumClique
-        return GRASPMaximumClique(graph, **params)
-    else:
+    factory = _ALGORITHMS.get(algorithm_type.lower())
+    if factory is None:
         raise ValueError(f"Tipo de algoritmo não suportado: {algorithm_type}")
+    
+    return factory(graph, **params)
@@ -14,20 +14,68 @@ The algorithm implements the specific techniques described in the paper:
 """
 
 import networkx as nx
+import numpy as np
 from pysat.solvers import Glucose3
-from pysat.formula import CNF
-from itertools import combinations
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import threading
 import time
 import logging
 import os
 import sys
 from typing import List, Set, Tuple, Optional, Dict
 
+try:
+    from . import _fast
+except ImportError:  # execução direta do módulo (python clisat_exact.py)
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from algorithms import _fast
+
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _pack_adjacency(graph: nx.Graph, node_to_index: Dict, n_words: Optional[int] = None) -> np.ndarray:
+    """
+    Empacotar a adjacência do grafo em palavras uint64.
+    
+    Args:
+        graph: Grafo NetworkX
+        node_to_index: Mapeamento vértice -> índice
+        n_words: Palavras por linha (padrão: ceil(n/64)); palavras extras ficam zeradas
+        
+    Returns:
+        Matriz uint64 (n x n_words); o bit j da linha i indica a aresta (i, j)
+    """
+    n = len(node_to_index)
+    if n_words is None:
+        n_words = (n + 63) >> 6
+    adj_words = np.zeros((n, n_words), dtype='<u8')
+    edges = np.array([(node_to_index[u], node_to_index[v]) for u, v in graph.edges() if u != v],
+                     dtype=np.int64).reshape(-1, 2)
+    rows = np.concatenate((edges[:, 0], edges[:, 1]))
+    cols = np.concatenate((edges[:, 1], edges[:, 0])).astype(np.uint64)
+    np.bitwise_or.at(adj_words, (rows, (cols >> np.uint64(6)).astype(np.int64)),
+                     np.uint64(1) << (cols & np.uint64(63)))
+    return adj_words
+
+
+@lru_cache(maxsize=None)
+def _class_pairs(m: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Pares (i, j), i < j, de posições de uma classe de cor de tamanho m."""
+    return np.triu_indices(m, k=1)
+
+
+def _iter_bits(mask: int):
+    """Iterar os índices dos bits ligados de uma máscara, em ordem crescente."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
 class CliSAT:
     """
     CliSAT algorithm implementation based on the original paper.
@@ -36,8 +84,11 @@ class CliSAT:
     in the CliSAT paper, including all the specific algorithms mentioned.
     """
     
+    # Período (segundos) de verificação do monitor de progresso
+    MONITOR_INTERVAL = 0.5
+    
     def __init__(self, graph: nx.Graph, time_limit: float = 3600.0, log_interval: int = 1000, 
-                 time_interval: float = 30.0):
+                 time_interval: float = 30.0, n_workers: int = 1):
         """
         Initialize the CliSAT solver.
         
@@ -46,6 +97,8 @@ class CliSAT:
             time_limit: Maximum time limit in seconds (default: 1 hour)
             log_interval: Intervalo para logs periódicos (número de nós processados)
             time_interval: Intervalo de tempo para logs periódicos (segundos)
+            n_workers: Processos para explorar as subárvores da raiz em paralelo
+                (1 = sequencial)
         """
         self.graph = graph
         self.n = graph.number_of_nodes()
@@ -53,23 +106,26 @@ class CliSAT:
         self.start_time = None
         self.log_interval = log_interval
         self.time_interval = time_interval
+        self.n_workers = n_workers
         
-        # Criar matriz de adjacência
-        self.adj_matrix = nx.adjacency_matrix(graph).todense()
+        # Limite inferior compartilhado entre processos (apenas nos workers)
+        self._shared_lb = None
         
         # Variáveis para o melhor clique encontrado
         self.max_clique = []
+        self.max_clique_idx = []  # O mesmo clique em índices (usado na busca)
         self.lb = 0  # Lower bound (best clique size found so far)
         
         # Estruturas específicas do algoritmo CliSAT
         self.mu = {}  # Incremental upper bounds (Seção 2.4)
-        self.coloring = {}  # Armazena colorações parciais
         self.initial_ordering = []  # COLOR-SORT ordering
+        self.ordering_idx = np.empty(0, dtype=np.int32)  # Mesma ordenação em índices
         
         # Estatísticas
         self.stats = {
             'nodes_explored': 0,
             'sat_calls': 0,
+            'sat_avoided': 0,
             'pruned_by_bound': 0,
             'filter_phase_calls': 0,
             'satcol_calls': 0
@@ -84,7 +140,26 @@ class CliSAT:
         
         # Mapeamento de nós para trabalhar com índices consistentes
         self.node_to_index = {node: i for i, node in enumerate(sorted(graph.nodes()))}
-        self.index_to_node = {i: node for node, i in self.node_to_index.items()}
+        self.index_to_node = sorted(graph.nodes())
+        
+        # Vizinhanças empacotadas em palavras uint64 (n x n_words): bit j da
+        # linha i indica a aresta (i, j). Usadas pelos kernels Numba, com
+        # n_words arredondado para um tamanho de kernel especializado
+        self.n_words = _fast.padded_word_count(self.n)
+        self.adj_words = _pack_adjacency(graph, self.node_to_index, self.n_words)
+        self._iseq_kernel, self._is_k_colorable_kernel = _fast.make_bitset_kernels(self.n_words)
+        
+        # As mesmas vizinhanças como bitsets (int Python); subgrafos induzidos
+        # são máscaras de vértices
+        self.adj_bits = [int.from_bytes(row.tobytes(), 'little') for row in self.adj_words]
+        
+        # Graus por índice, calculados uma vez (lista para chaves de ordenação)
+        self.degrees = np.fromiter((m.bit_count() for m in self.adj_bits), dtype=np.int32, count=self.n)
+        self._degree_list = self.degrees.tolist()
+    
+    def _mask_to_words(self, mask: int) -> np.ndarray:
+        """Converter uma máscara de vértices em vetor de palavras uint64."""
+        return np.frombuffer(mask.to_bytes(self.n_words * 8, 'little'), dtype='<u8')
     
     def _log_progress(self, force: bool = False):
         """
@@ -111,13 +186,39 @@ class CliSAT:
         
         if force:
             print(f"\n🔍 Progresso: {hours:02d}:{minutes:02d}:{seconds:02d} - "
-                  f"Melhor clique: {len(self.max_clique)} vértices")
+                  f"Melhor clique: {self.lb} vértices")
         else:
-            print(f"🔍 {hours:02d}:{minutes:02d}:{seconds:02d} - Melhor: {len(self.max_clique)}")
+            print(f"🔍 {hours:02d}:{minutes:02d}:{seconds:02d} - Melhor: {self.lb}")
         
         self.last_log_nodes = self.stats['nodes_explored']
         self.last_log_time = current_time
 
+    def _monitor_loop(self, stop: threading.Event) -> None:
+        """
+        Monitorar a busca em segundo plano.
+        
+        Anuncia cada novo melhor clique e emite os logs periódicos, lendo
+        self.lb e self.stats a cada MONITOR_INTERVAL segundos.
+        
+        Args:
+            stop: Evento que encerra o monitor
+        """
+        reported_lb = self.lb
+        while not stop.wait(self.MONITOR_INTERVAL):
+            lb = self.lb
+            if lb > reported_lb:
+                reported_lb = lb
+                elapsed = time.time() - self.start_time
+                hours = int(elapsed // 3600)
+                minutes = int((elapsed % 3600) // 60)
+                seconds = int(elapsed % 60)
+                
+                print(f"🎉 Novo clique: {lb} vértices ({hours:02d}:{minutes:02d}:{seconds:02d})")
+                
+                logger.info(f"Novo melhor clique encontrado: tamanho {lb}")
+            
+            self._log_progress()
+
     def _time_exceeded(self) -> bool:
         """Verificar se o tempo limite foi excedido."""
         if self.start_time is None:
@@ -141,6 +242,7 @@ class CliSAT:
         
         # Clique inicial guloso (limite inferior)
         self.max_clique = self.greedy_initial_solution()
+        self.max_clique_idx = [self.node_to_index[v] for v in self.max_clique]
         self.lb = len(self.max_clique)
         logger.info(f"Clique inicial (guloso): tamanho {self.lb}")
         
@@ -148,46 +250,44 @@ class CliSAT:
         
         # COLOR-SORT (Seção 2.5)
         self.initial_ordering = self.color_sort()
+        self.ordering_idx = np.array([self.node_to_index[v] for v in self.initial_ordering],
+                                     dtype=np.int32)
+        ordering = self.ordering_idx.tolist()
         
         # Algoritmo principal do CliSAT
         print(f"🔄 Iniciando busca...")
         
-        for i in range(self.lb, self.n):
-            if self._time_exceeded():
-                # Adicionar estimativa de tempo
-                from utils.timeout_estimator import TimeoutEstimator
-                
-                current_time = time.time() - self.start_time
-                estimate = TimeoutEstimator.estimate_clisat_time(
-                    stats=self.stats,
-                    current_time=current_time,
-                    graph_size=self.n,
-                    current_bound=self.lb
-                )
-                
-                print(TimeoutEstimator.format_time_estimate(estimate))
-                
-                # Salvar para relatório
-                self.timeout_estimate = estimate
-                
-                logger.warning("Tempo limite excedido")
-                print(f"\n⏰ Tempo limite de {self.time_limit}s excedido!")
-                break
-                
-            vi = self.initial_ordering[i]
-            # V_hat: vértices anteriores na ordenação que são adjacentes a vi
-            V_hat = [v for v in self.initial_ordering[:i] 
-                    if self.adj_matrix[self.node_to_index[vi], self.node_to_index[v]] == 1]
-            
-            if not V_hat:
-                continue
-                
-            # Criar subgrafo induzido por V_hat
-            G_hat = self.graph.subgraph(V_hat)
-            self.find_max_clique(G_hat, [vi], self.lb)
-            
-            # Log periódico
-            self._log_progress()
+        # prefix_mask: vértices que precedem vi na ordenação (como máscara)
+        prefix_mask = 0
+        for i_v in ordering[:self.lb]:
+            prefix_mask |= 1 << i_v
+        
+        # Logs periódicos em thread separada: a busca não faz E/S
+        stop_monitor = threading.Event()
+        monitor = threading.Thread(target=self._monitor_loop, args=(stop_monitor,), daemon=True)
+        monitor.start()
+        
+        try:
+            if self.n_workers > 1:
+                self._solve_parallel(prefix_mask)
+            else:
+                for i in range(self.lb, self.n):
+                    if self._time_exceeded():
+                        self._report_timeout()
+                        break
+                        
+                    i_vi = ordering[i]
+                    # V_hat: vértices anteriores na ordenação que são adjacentes a vi
+                    V_hat = self.adj_bits[i_vi] & prefix_mask
+                    prefix_mask |= 1 << i_vi
+                    
+                    if not V_hat:
+                        continue
+                    
+                    self.find_max_clique(V_hat, 1 << i_vi, 1, self.lb)
+        finally:
+            stop_monitor.set()
+            monitor.join()
         
         # Log final forçado
         self._log_progress(force=True)
@@ -195,6 +295,8 @@ class CliSAT:
         total_time = time.time() - self.start_time
         print(f"\n🏁 CliSAT FINALIZADO!")
         print(f"   ⏱️  Tempo total: {total_time:.2f}s")
+        self.max_clique = [self.index_to_node[i] for i in self.max_clique_idx]
+        assert self._is_clique_mask(self.clique_bitmask), "CliSAT produziu um conjunto que não é clique"
         print(f"   🎯 Clique máximo: {len(self.max_clique)} vértices")
         
         logger.info(f"CliSAT finalizado em {total_time:.2f}s")
@@ -202,13 +304,83 @@ class CliSAT:
         
         return self.max_clique, self.lb
 
-    def find_max_clique(self, G_hat: nx.Graph, K_hat: List, lb: int) -> None:
+    def _report_timeout(self) -> None:
+        """Registrar a estimativa de tempo restante quando o limite é excedido."""
+        # Adicionar estimativa de tempo
+        from utils.timeout_estimator import TimeoutEstimator
+        
+        current_time = time.time() - self.start_time
+        estimate = TimeoutEstimator.estimate_clisat_time(
+            stats=self.stats,
+            current_time=current_time,
+            graph_size=self.n,
+            current_bound=self.lb
+        )
+        
+        print(TimeoutEstimator.format_time_estimate(estimate))
+        
+        # Salvar para relatório
+        self.timeout_estimate = estimate
+        
+        logger.warning("Tempo limite excedido")
+        print(f"\n⏰ Tempo limite de {self.time_limit}s excedido!")
+
+    def _solve_parallel(self, prefix_mask: int) -> None:
+        """
+        Explorar as subárvores da raiz em processos separados.
+        
+        Cada vértice vi da ordenação gera um subproblema independente
+        (V_hat, {vi}). Os workers compartilham o melhor tamanho encontrado
+        por um multiprocessing.Value, usado para podar nos demais processos.
+        
+        Args:
+            prefix_mask: Vértices que precedem initial_ordering[lb] (máscara)
+        """
+        roots = []
+        ordering = self.ordering_idx.tolist()
+        for i in range(self.lb, self.n):
+            i_vi = ordering[i]
+            V_hat = self.adj_bits[i_vi] & prefix_mask
+            prefix_mask |= 1 << i_vi
+            if V_hat:
+                roots.append((V_hat, i_vi))
+        
+        shared_lb = multiprocessing.Value('i', self.lb)
+        with ProcessPoolExecutor(max_workers=self.n_workers,
+                                 initializer=_init_root_worker,
+                                 initargs=(self.graph, self.time_limit, self.log_interval,
+                                           self.time_interval, shared_lb)) as pool:
+            futures = [pool.submit(_explore_root, V_hat, i_vi, self.start_time)
+                       for V_hat, i_vi in roots]
+            
+            for future in as_completed(futures):
+                clique, stats = future.result()
+                for key, value in stats.items():
+                    self.stats[key] += value
+                if len(clique) > self.lb:
+                    self.lb = len(clique)
+                    self.max_clique_idx = clique
+        
+        if self._time_exceeded():
+            self._report_timeout()
+
+    def _update_lb(self, K_mask: int, K_size: int) -> None:
+        """Registrar um clique melhor e divulgá-lo aos demais workers."""
+        self.lb = K_size
+        self.max_clique_idx = list(_iter_bits(K_mask))
+        if self._shared_lb is not None:
+            with self._shared_lb.get_lock():
+                if self.lb > self._shared_lb.value:
+                    self._shared_lb.value = self.lb
+
+    def find_max_clique(self, G_hat: int, K_mask: int, K_size: int, lb: int) -> None:
         """
         Algoritmo recursivo principal para encontrar clique máximo.
         
         Args:
-            G_hat: Subgrafo atual
-            K_hat: Clique parcial atual
+            G_hat: Subgrafo atual (máscara de vértices)
+            K_mask: Clique parcial atual (máscara de vértices)
+            K_size: Tamanho do clique parcial
             lb: Lower bound atual
         """
         self.stats['nodes_explored'] += 1
@@ -216,315 +388,376 @@ class CliSAT:
         if self._time_exceeded():
             return
         
-        # Atualizar melhor clique se necessário
-        if len(K_hat) > self.lb:
-            self.lb = len(K_hat)
-            self.max_clique = K_hat.copy()
-            
-            # Log de novo clique
-            elapsed = time.time() - self.start_time
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = int(elapsed % 60)
-            
-            print(f"🎉 Novo clique: {self.lb} vértices ({hours:02d}:{minutes:02d}:{seconds:02d})")
-            
-            logger.info(f"Novo melhor clique encontrado: tamanho {self.lb}")
+        # Limite encontrado por outros workers (execução paralela)
+        if self._shared_lb is not None and self._shared_lb.value > self.lb:
+            self.lb = self._shared_lb.value
+        
+        # Atualizar melhor clique se necessário (o anúncio fica com o monitor)
+        if K_size > self.lb:
+            self._update_lb(K_mask, K_size)
         
         # Compute pruned and branching sets
-        P, B = self.compute_pruned_and_branching_sets(G_hat, K_hat, lb)
+        P, B, branch_order = self.compute_pruned_and_branching_sets(G_hat, K_size, lb)
         
         if not B:
             self.stats['pruned_by_bound'] += 1
             return
         
-        # Branch sobre cada vértice em B
-        for b in B:
+        # Branch sobre cada vértice em B (maior cor primeiro)
+        for b in branch_order:
             if self._time_exceeded():
                 break
-                
-            # Calcular V_child: vértices adjacentes a b
-            V_child = []
             
-            # Adicionar vértices de P adjacentes a b
-            for v in P:
-                if G_hat.has_edge(b, v):
-                    V_child.append(v)
-            
-            # Adicionar vértices de B adjacentes a b (com ordem lexicográfica)
-            for v in B:
-                if v != b and G_hat.has_edge(b, v) and v < b:
-                    V_child.append(v)
+            # V_child: vértices de P adjacentes a b e vértices de B adjacentes
+            # a b que o precedem (ordem lexicográfica)
+            adj_b = self.adj_bits[b]
+            V_child = (P & adj_b) | (B & adj_b & ((1 << b) - 1))
             
             if not V_child:
                 # Nó folha: verificar se encontramos um clique melhor
-                new_clique_size = len(K_hat) + 1
-                if new_clique_size > self.lb:
-                    self.lb = new_clique_size
-                    self.max_clique = K_hat + [b]
-                    logger.info(f"Clique folha encontrado: tamanho {self.lb}")
+                if K_size + 1 > self.lb:
+                    self._update_lb(K_mask | (1 << b), K_size + 1)
                 continue
             
-            # Criar subgrafo filho
-            G_child = G_hat.subgraph(V_child)
-            
-            # Decidir qual fase usar baseado na estrutura do grafo
-            if self.is_k_partite(G_child, self.lb - len(K_hat)):
+            # Decidir qual fase usar baseado na estrutura do grafo; o filho
+            # estende o clique para K_size + 1 e só interessa se V_child
+            # contiver um clique com mais de lb - (K_size + 1) vértices
+            if self._is_k_colorable(V_child, self.lb - K_size - 1):
                 # Usar Filter Phase (Seções 2.3.1 e 2.3.2)
-                P_child, B_child = self.filter_phase(G_child, K_hat)
+                P_child, B_child = self.filter_phase(V_child, K_size + 1)
                 self.stats['filter_phase_calls'] += 1
             else:
                 # Usar SATCOL (Seção 2.2.2)
-                P_child, B_child = self.satcol(G_child, K_hat)
+                P_child, B_child = self.satcol(V_child, K_size + 1)
                 self.stats['satcol_calls'] += 1
             
             # Recursão se há vértices para explorar
             if B_child:
-                self.find_max_clique(G_child, K_hat + [b], self.lb)
+                self.find_max_clique(V_child, K_mask | (1 << b), K_size + 1, self.lb)
             else:
                 # Poda: sem vértices para continuar a busca
                 self.stats['pruned_by_bound'] += 1
 
-    def compute_pruned_and_branching_sets(self, G_hat: nx.Graph, K_hat: List, lb: int) -> Tuple[List, List]:
+    def compute_pruned_and_branching_sets(self, G_hat: int, K_size: int, lb: int) -> Tuple[int, int, List[int]]:
         """
         Compute pruned and branching sets usando ISEQ + SATCOL.
         
+        O subgrafo é colorido por completo: um vértice de cor c só pode
+        completar um clique de tamanho K_size + c, então os vértices das k
+        primeiras classes são podados e os demais formam B, percorrido da
+        maior para a menor cor (limites mais altos primeiro) e, entre cores
+        iguais, do maior para o menor grau.
+        
         Args:
-            G_hat: Subgrafo atual
-            K_hat: Clique parcial atual  
+            G_hat: Subgrafo atual (máscara de vértices)
+            K_size: Tamanho do clique parcial atual
             lb: Lower bound
             
         Returns:
-            Tuple (P, B) onde P são vértices podados e B são vértices de branching
+            Tuple (P, B, ordem): máscaras dos vértices podados e de branching,
+            e os índices de B na ordem de branching
         """
-        k = lb - len(K_hat)
+        k = max(lb - K_size, 0)
         
         # ISEQ: Incremental Sequential Coloring (Seção 2.2)
-        P_c = self.iseq_coloring(G_hat, k)
+        classes = self.iseq_coloring(G_hat, G_hat.bit_count())
+        P_c = classes[:k]
+        color_of = {}
+        for color, color_class in enumerate(classes[k:], start=k + 1):
+            for v in _iter_bits(color_class):
+                color_of[v] = color
         
         # SATCOL: SAT-based coloring refinement (Seção 2.2.2)
-        P, B = self.satcol(G_hat, K_hat, P_c)
+        P, B = self.satcol(G_hat, K_size, P_c)
         
-        return P, B
+        # Maior cor primeiro; empates pelo maior grau
+        degrees = self._degree_list
+        branch_order = sorted(_iter_bits(B), key=lambda v: (-color_of[v], -degrees[v]))
+        return P, B, branch_order
 
-    def iseq_coloring(self, G: nx.Graph, k: int) -> List[List]:
+    def iseq_coloring(self, G: int, k: int) -> List[int]:
         """
         ISEQ: Incremental Sequential Coloring (Seção 2.2).
         
         Encontra k classes de cores (conjuntos independentes) no grafo.
         
         Args:
-            G: Grafo para colorir
+            G: Subgrafo a colorir (máscara de vértices)
             k: Número máximo de cores
             
         Returns:
-            Lista de classes de cores (cada classe é uma lista de vértices)
+            Lista de classes de cores (cada classe é uma máscara de vértices)
         """
+        if _fast.NUMBA_AVAILABLE:
+            return self._iseq_coloring_numba(G, k)
+        
         coloring = []
-        uncolored = list(G.nodes())
+        uncolored = G
+        adj_bits = self.adj_bits
         
         while len(coloring) < k and uncolored:
-            independent_set = []
-            remaining = uncolored.copy()
+            independent_set = 0
             
-            for v in remaining:
-                # Verificar se v pode ser adicionado ao conjunto independente
-                if all(not G.has_edge(v, u) for u in independent_set):
-                    independent_set.append(v)
-                    uncolored.remove(v)
+            for v in _iter_bits(uncolored):
+                # v pode entrar na classe se não é vizinho de nenhum membro
+                if not independent_set & adj_bits[v]:
+                    independent_set |= 1 << v
             
-            if independent_set:
-                coloring.append(independent_set)
-            else:
-                break
+            # A classe nunca é vazia: o primeiro vértice não colorido sempre entra
+            coloring.append(independent_set)
+            uncolored &= ~independent_set
         
         return coloring
 
-    def satcol(self, G: nx.Graph, K_hat: List, P_c: Optional[List[List]] = None) -> Tuple[List, List]:
+    def _iseq_coloring_numba(self, G: int, k: int) -> List[int]:
+        """ISEQ pelo kernel compilado; mesmas classes de iseq_coloring."""
+        if k <= 0 or not G:
+            return []
+        colors_flat, class_starts = self._iseq_kernel(self.adj_words, self._mask_to_words(G), k)
+        colors_flat = colors_flat.tolist()
+        class_starts = class_starts.tolist()
+        
+        coloring = []
+        for start, end in zip(class_starts, class_starts[1:]):
+            color_class = 0
+            for v in colors_flat[start:end]:
+                color_class |= 1 << v
+            coloring.append(color_class)
+        return coloring
+
+    def satcol(self, G: int, K_size: int, P_c: Optional[List[int]] = None) -> Tuple[int, int]:
         """
         SATCOL: SAT-based coloring refinement (Seção 2.2.2).
         
         Args:
-            G: Grafo atual
-            K_hat: Clique parcial atual
+            G: Subgrafo atual (máscara de vértices)
+            K_size: Tamanho do clique parcial atual
             P_c: Coloração prévia (opcional)
             
         Returns:
-            Tuple (P, B) onde P são vértices podados e B são vértices de branching
+            Tuple (P, B) de máscaras: P são vértices podados e B são vértices de branching
         """
         if P_c is None:
-            P_c = self.iseq_coloring(G, self.lb - len(K_hat))
+            P_c = self.iseq_coloring(G, self.lb - K_size)
         
         # P: vértices que podem ser podados (estão nas classes de cor)
-        P = [v for color_class in P_c for v in color_class]
+        P = 0
+        for color_class in P_c:
+            P |= color_class
         
         # B: vértices restantes que precisam de branching
-        B = [v for v in G.nodes() if v not in P]
+        B = G & ~P
+        
+        # Pré-teste barato: se N(v) ∩ P admite ISEQ com menos de k cores, não
+        # há k-clique em N(v) ∩ P e v não melhora o limite; dispensa o SAT
+        k = self.lb - K_size
+        sat_candidates = []
+        for v in _iter_bits(B):
+            if len(self.iseq_coloring(self.adj_bits[v] & P, k)) < k:
+                P |= 1 << v
+                B &= ~(1 << v)
+                self.stats['sat_avoided'] += 1
+            else:
+                sat_candidates.append(v)
         
-        # Refinar usando failed literal detection
-        for v in B.copy():
-            if self.is_failed_literal(G, v, P_c):
-                P.append(v)
-                B.remove(v)
+        # Refinar usando failed literal detection (um único solver para todos)
+        for v in self._probe_failed_literals(P_c, sat_candidates):
+            P |= 1 << v
+            B &= ~(1 << v)
         
         return P, B
 
-    def is_failed_literal(self, G: nx.Graph, v, coloring: List[List]) -> bool:
+    def is_failed_literal(self, v: int, coloring: List[int]) -> bool:
         """
         Verificar se um vértice é um failed literal usando SAT.
         
         Args:
-            G: Grafo atual
-            v: Vértice a verificar
-            coloring: Coloração atual
+            v: Índice do vértice a verificar
+            coloring: Coloração atual (máscaras de vértices)
             
         Returns:
             True se v é failed literal, False caso contrário
         """
-        self.stats['sat_calls'] += 1
+        return bool(self._probe_failed_literals(coloring, [v]))
+
+    def _probe_failed_literals(self, coloring: List[int], candidates: List[int]) -> List[int]:
+        """
+        Testar vários vértices como failed literals com um solver incremental.
         
-        # Criar nova coloração incluindo v
-        extended_coloring = coloring + [[v]]
-        cnf = self.build_pmax_sat(G, extended_coloring)
+        A fórmula P-MAX da coloração é carregada uma única vez; cada candidato
+        v (equivalente a acrescentar a classe unitária {v}) é testado com a
+        suposição x_v, reaproveitando as cláusulas aprendidas entre consultas.
         
-        # Resolver usando SAT solver
-        with Glucose3(bootstrap_with=cnf) as solver:
-            return not solver.solve()
+        Args:
+            coloring: Coloração atual (máscaras de vértices)
+            candidates: Índices dos vértices a verificar, em ordem
+            
+        Returns:
+            Lista dos candidatos que são failed literals, na mesma ordem
+        """
+        if not candidates:
+            return []
+        
+        clauses, vertex_to_var = self.build_pmax_sat(coloring)
+        next_var = len(vertex_to_var) + 1
+        failed = []
+        
+        with Glucose3(bootstrap_with=clauses) as solver:
+            for v in candidates:
+                self.stats['sat_calls'] += 1
+                var = vertex_to_var.get(v)
+                if var is None:
+                    var = next_var
+                    next_var += 1
+                if not solver.solve(assumptions=[var]):
+                    failed.append(v)
+        
+        return failed
 
-    def build_pmax_sat(self, G: nx.Graph, coloring: List[List]) -> CNF:
+    def build_pmax_sat(self, coloring: List[int]) -> Tuple[List[List[int]], Dict[int, int]]:
         """
         Construir fórmula SAT P-MAX (Partial Maximum Clique).
         
+        As classes vêm do ISEQ e são conjuntos independentes disjuntos: todo
+        par dentro de uma classe é uma não-aresta e cada classe recebe um
+        bloco contíguo de variáveis.
+        
         Args:
-            G: Grafo atual
-            coloring: Classes de cores
+            coloring: Classes de cores (máscaras de vértices)
             
         Returns:
-            Fórmula CNF para o problema
+            Tuple (cláusulas CNF como listas de literais, mapeamento vértice -> variável SAT)
         """
-        cnf = CNF()
-        
-        # Mapear vértices para variáveis SAT (1-indexed)
         vertex_to_var = {}
-        var_counter = 1
-        
-        for color_class in coloring:
-            for v in color_class:
-                if v not in vertex_to_var:
-                    vertex_to_var[v] = var_counter
-                    var_counter += 1
+        clauses = []
+        at_least_one = []
+        offset = 1
         
-        # Restrições de clique: se dois vértices não são adjacentes,
-        # não podem estar ambos no clique
-        for color_class in coloring:
-            for u, v in combinations(color_class, 2):
-                if not G.has_edge(u, v):
-                    # ¬x_u ∨ ¬x_v
-                    var_u = vertex_to_var.get(u)
-                    var_v = vertex_to_var.get(v)
-                    if var_u and var_v:
-                        cnf.append([-var_u, -var_v])
-        
-        # Restrição de cardinalidade: pelo menos um vértice de cada classe
         for color_class in coloring:
-            if color_class:
-                clause = [vertex_to_var[v] for v in color_class if v in vertex_to_var]
-                if clause:
-                    cnf.append(clause)
+            members = list(_iter_bits(color_class))
+            m = len(members)
+            if not m:
+                continue
+            
+            # Mapear vértices para variáveis SAT (1-indexed)
+            vertex_to_var.update(zip(members, range(offset, offset + m)))
+            
+            # Restrições de clique: dois vértices não adjacentes não podem
+            # estar ambos no clique (¬x_u ∨ ¬x_v para cada par da classe)
+            if m > 1:
+                first, second = _class_pairs(m)
+                clauses.extend(np.stack((-offset - first, -offset - second), axis=1).tolist())
+            
+            # Restrição de cardinalidade: pelo menos um vértice de cada classe
+            at_least_one.append(list(range(offset, offset + m)))
+            offset += m
         
-        return cnf
+        clauses.extend(at_least_one)
+        return clauses, vertex_to_var
 
-    def filter_phase(self, G: nx.Graph, K_hat: List) -> Tuple[List, List]:
+    def filter_phase(self, G: int, K_size: int) -> Tuple[int, int]:
         """
         Filter Phase: FiltCOL + FiltSAT (Seções 2.3.1 e 2.3.2).
         
         Args:
-            G: Grafo atual
-            K_hat: Clique parcial atual
+            G: Subgrafo atual (máscara de vértices)
+            K_size: Tamanho do clique parcial atual
             
         Returns:
-            Tuple (P, B) onde P são vértices podados e B são vértices de branching
+            Tuple (P, B) de máscaras: P são vértices podados e B são vértices de branching
         """
         # FiltCOL (Seção 2.3.1)
-        P_filt = self.filtcol(G)
-        B_filt = [v for v in G.nodes() if v not in P_filt]
+        P_filt = self.filtcol(G, self.lb - K_size)
+        B_filt = G & ~P_filt
         
         # FiltSAT (Seção 2.3.2)
         P_final, B_final = self.filtsat(G, P_filt, B_filt)
         
         return P_final, B_final
 
-    def filtcol(self, G: nx.Graph) -> List:
+    def filtcol(self, G: int, k: int) -> int:
         """
         FiltCOL: Filter using coloring information (Seção 2.3.1).
         
+        Os vértices cobertos pelas k primeiras classes formam um subgrafo
+        k-colorível, sem clique com mais de k vértices; só eles podem ser
+        filtrados.
+        
         Args:
-            G: Grafo atual
+            G: Subgrafo atual (máscara de vértices)
+            k: Maior clique que ainda não melhora o limite
             
         Returns:
-            Lista de vértices que podem ser filtrados
+            Máscara dos vértices que podem ser filtrados
         """
         # Implementação simplificada: usar coloração de referência
-        filtered = set()
-        graph_id = id(G)
-        reference_coloring = self.coloring.get(graph_id, [])
-        
-        # Se não há coloração de referência, criar uma nova
-        if not reference_coloring:
-            reference_coloring = self.iseq_coloring(G, min(len(G.nodes()), self.lb))
-            self.coloring[graph_id] = reference_coloring
+        k = min(G.bit_count(), max(k, 0))
+        reference_coloring = self.iseq_coloring(G, k)
         
         # Filtrar vértices que não estão em nenhuma classe de cor viável
-        all_colored = set()
+        all_colored = 0
         for color_class in reference_coloring:
-            all_colored.update(color_class)
+            all_colored |= color_class
         
-        return [v for v in G.nodes() if v in all_colored]
+        return G & all_colored
 
-    def filtsat(self, G: nx.Graph, P: List, B: List) -> Tuple[List, List]:
+    def filtsat(self, G: int, P: int, B: int) -> Tuple[int, int]:
         """
         FiltSAT: SAT-based filtering (Seção 2.3.2).
         
         Args:
-            G: Grafo atual
-            P: Vértices previamente filtrados
-            B: Vértices candidatos a branching
+            G: Subgrafo atual (máscara de vértices)
+            P: Vértices previamente filtrados (máscara)
+            B: Vértices candidatos a branching (máscara)
             
         Returns:
-            Tuple (P_final, B_final) após refinamento SAT
+            Tuple (P_final, B_final) de máscaras após refinamento SAT
         """
-        P_final = P.copy()
-        B_final = B.copy()
+        P_final = P
+        B_final = B
         
         # Aplicar failed literal detection nos vértices de B
-        for v in B.copy():
-            coloring = self.iseq_coloring(G.subgraph(P_final + [v]), len(P_final) + 1)
-            if self.is_failed_literal(G, v, coloring):
-                P_final.append(v)
-                B_final.remove(v)
+        for v in _iter_bits(B):
+            coloring = self.iseq_coloring(P_final | (1 << v), P_final.bit_count() + 1)
+            if self.is_failed_literal(v, coloring):
+                P_final |= 1 << v
+                B_final &= ~(1 << v)
         
         return P_final, B_final
 
-    def is_k_partite(self, G: nx.Graph, k: int) -> bool:
+    def _is_k_colorable(self, G: int, k: int) -> bool:
         """
-        Verificar se o grafo é k-partite.
+        Verificar se o ISEQ colore o subgrafo com no máximo k cores.
+        
+        Equivale a colorir com iseq_coloring e conferir se todos os vértices
+        receberam cor, mas para assim que a resposta é conhecida.
         
         Args:
-            G: Grafo a verificar
-            k: Número de partições
+            G: Subgrafo a verificar (máscara de vértices)
+            k: Número de cores
             
         Returns:
-            True se G é k-partite, False caso contrário
+            True se G é k-partite pela coloração ISEQ, False caso contrário
         """
-        if len(G.nodes()) == 0:
+        if not G:
             return True
+        if k <= 0:
+            return False
         
-        coloring = self.iseq_coloring(G, k)
-        
-        # O grafo é k-partite se conseguimos colori-lo com exatamente k cores
-        # e cada classe de cor é um conjunto independente válido
-        total_colored = sum(len(color_class) for color_class in coloring)
-        return total_colored == len(G.nodes()) and len(coloring) <= k
+        if _fast.NUMBA_AVAILABLE:
+            return bool(self._is_k_colorable_kernel(self.adj_words, self._mask_to_words(G), k))
+        
+        adj_bits = self.adj_bits
+        uncolored = G
+        for _ in range(k):
+            independent_set = 0
+            for v in _iter_bits(uncolored):
+                if not independent_set & adj_bits[v]:
+                    independent_set |= 1 << v
+            uncolored &= ~independent_set
+            if not uncolored:
+                return True
+        return False
 
     def color_sort(self) -> List:
         """
@@ -537,26 +770,33 @@ class CliSAT:
             Lista ordenada de vértices
         """
         vertices = list(self.graph.nodes())
-        
-        # Implementação baseada em grau decrescente + características adicionais
-        def sort_key(v):
-            degree = self.graph.degree(v)
-            # Adicionar critérios adicionais baseados na estrutura local
-            neighbors = list(self.graph.neighbors(v))
-            if neighbors:
-                # Densidade da vizinhança
-                subgraph = self.graph.subgraph(neighbors)
-                neighbor_edges = len(subgraph.edges())
-                max_edges = len(neighbors) * (len(neighbors) - 1) // 2
-                density = neighbor_edges / max_edges if max_edges > 0 else 0
-            else:
-                density = 0
-            
-            # Priorizar vértices com alto grau e alta densidade na vizinhança
-            return (-degree, -density)
-        
-        vertices.sort(key=sort_key)
-        return vertices
+        if not vertices:
+            return vertices
+        
+        # Matriz de adjacência densa (float32) desempacotada dos bitsets
+        adj = np.unpackbits(self.adj_words.view(np.uint8), axis=1, count=self.n,
+                            bitorder='little').astype(np.float32)
+        degree = self.degrees.astype(np.int64)
+        
+        # Arestas na vizinhança de v: ½·Σ_u A[v,u]·(A²)[v,u], em blocos de
+        # linhas para limitar a memória do produto matricial
+        neighbor_edges = np.empty(self.n, dtype=np.int64)
+        block = 1024
+        for start in range(0, self.n, block):
+            rows = adj[start:start + block]
+            paths = rows @ adj
+            neighbor_edges[start:start + block] = np.rint((rows * paths).sum(axis=1)).astype(np.int64) // 2
+        
+        # Densidade da vizinhança
+        max_edges = degree * (degree - 1) // 2
+        density = np.zeros(self.n, dtype=np.float64)
+        np.divide(neighbor_edges, max_edges, out=density, where=max_edges > 0)
+        
+        # Priorizar vértices com alto grau e alta densidade na vizinhança;
+        # empates mantêm a ordem de graph.nodes()
+        idx = np.fromiter((self.node_to_index[v] for v in vertices), dtype=np.int64, count=self.n)
+        order = np.lexsort((np.arange(self.n), -density[idx], -degree[idx]))
+        return [vertices[i] for i in order]
 
     def greedy_initial_solution(self) -> List:
         """
@@ -569,34 +809,35 @@ class CliSAT:
             Lista de vértices formando um clique
         """
         # Ordenar vértices por grau decrescente
-        vertices = sorted(self.graph.nodes(), 
-                         key=lambda x: self.graph.degree(x), 
-                         reverse=True)
+        order = sorted((self.node_to_index[v] for v in self.graph.nodes()),
+                       key=self._degree_list.__getitem__,
+                       reverse=True)
+        adj_bits = self.adj_bits
         
         clique = []
-        
-        for v in vertices:
-            # Verificar se v é adjacente a todos os vértices no clique atual
-            if all(self.graph.has_edge(v, u) for u in clique):
-                clique.append(v)
-                
-                # Otimização: se o clique está ficando grande,
-                # focar nos vértices com maior grau na vizinhança comum
-                if len(clique) > 3:
-                    # Calcular vizinhança comum
-                    common_neighbors = set(self.graph.neighbors(clique[0]))
-                    for u in clique[1:]:
-                        common_neighbors &= set(self.graph.neighbors(u))
-                    
-                    # Reordenar vértices restantes priorizando vizinhança comum
-                    remaining = [x for x in vertices if x not in clique]
-                    remaining.sort(key=lambda x: (
-                        x in common_neighbors,
-                        self.graph.degree(x)
-                    ), reverse=True)
-                    vertices = clique + remaining
-        
-        return clique
+        # Vizinhança comum do clique: candidatos que ainda podem entrar
+        common = (1 << self.n) - 1
+        pos = 0
+        
+        while pos < len(order):
+            v = order[pos]
+            pos += 1
+            if not (common >> v) & 1:
+                continue
+            
+            clique.append(v)
+            common &= adj_bits[v]
+            if not common:
+                break
+            
+            # Otimização: se o clique está ficando grande, priorizar os
+            # candidatos com mais vizinhos dentro da vizinhança comum
+            if len(clique) > 3:
+                order = [x for x in order[pos:] if (common >> x) & 1]
+                order.sort(key=lambda x: (common & adj_bits[x]).bit_count(), reverse=True)
+                pos = 0
+        
+        return [self.index_to_node[v] for v in clique]
 
     def get_statistics(self) -> Dict:
         """
@@ -631,12 +872,38 @@ class CliSAT:
         if len(clique) <= 1:
             return True
         
-        # Verificar se todos os pares são adjacentes
-        for i, u in enumerate(clique):
-            for v in clique[i+1:]:
-                if not self.graph.has_edge(u, v):
-                    return False
+        try:
+            indices = [self.node_to_index[u] for u in clique]
+        except KeyError:
+            return False
+        
+        mask = 0
+        for i in indices:
+            mask |= 1 << i
+        if mask.bit_count() != len(indices):
+            return False  # vértice repetido
+        
+        return self._is_clique_mask(mask)
+    
+    @property
+    def clique_bitmask(self) -> int:
+        """Melhor clique encontrado como máscara de índices de vértices."""
+        mask = 0
+        for i in self.max_clique_idx:
+            mask |= 1 << i
+        return mask
+    
+    def _is_clique_mask(self, mask: int) -> bool:
+        """
+        Verificar se uma máscara de vértices é um clique.
         
+        Cada vértice deve ser adjacente a todos os demais: uma operação sobre
+        bitsets por vértice em vez de uma consulta por par.
+        """
+        for i in _iter_bits(mask):
+            rest = mask & ~(1 << i)
+            if self.adj_bits[i] & rest != rest:
+                return False
         return True
 
     def print_solution_summary(self) -> None:
@@ -644,7 +911,7 @@ class CliSAT:
         print(f"\n=== Resumo da Solução ===")
         print(f"Grafo: {self.n} vértices, {len(self.graph.edges())} arestas")
         print(f"Tamanho do clique máximo: {self.lb}")
-        print(f"Clique válido: {self.verify_clique(self.max_clique)}")
+        print(f"Clique válido: {self._is_clique_mask(self.clique_bitmask)}")
         
         stats = self.get_statistics()
         print(f"\n=== Estatísticas de Execução ===")
@@ -662,8 +929,45 @@ class CliSAT:
             os.system('clear')
 
 
+# Solver do processo worker (execução paralela), criado uma vez por processo
+_ROOT_SOLVER: Optional[CliSAT] = None
+
+
+def _init_root_worker(graph: nx.Graph, time_limit: float, log_interval: int,
+                      time_interval: float, shared_lb) -> None:
+    """Inicializar o solver local de um processo worker."""
+    global _ROOT_SOLVER
+    _ROOT_SOLVER = CliSAT(graph, time_limit, log_interval, time_interval)
+    _ROOT_SOLVER._shared_lb = shared_lb
+
+
+def _explore_root(V_hat: int, i_vi: int, start_time: float) -> Tuple[List, Dict]:
+    """
+    Explorar a subárvore da raiz (V_hat, {vi}) em um processo worker.
+    
+    Args:
+        V_hat: Vizinhos de vi que o precedem na ordenação (máscara)
+        i_vi: Índice do vértice raiz
+        start_time: Início da execução no processo principal
+        
+    Returns:
+        Tuple (índices do clique encontrado pelo worker ou [], estatísticas da subárvore)
+    """
+    solver = _ROOT_SOLVER
+    solver.start_time = start_time
+    solver.max_clique_idx = []
+    solver.lb = solver._shared_lb.value
+    stats_before = dict(solver.stats)
+    
+    solver.find_max_clique(V_hat, 1 << i_vi, 1, solver.lb)
+    
+    stats = {key: value - stats_before[key] for key, value in solver.stats.items()}
+    return solver.max_clique_idx, stats
+
+
 def solve_maximum_clique_clisat(graph: nx.Graph, time_limit: float = 3600.0, 
-                                log_interval: int = 1000, time_interval: float = 30.0) -> Tuple[List, int, Dict]:
+                                log_interval: int = 1000, time_interval: float = 30.0,
+                                n_workers: int = 1) -> Tuple[List, int, Dict]:
     """
     Função conveniente para resolver o problema do clique máximo usando CliSAT.
     
@@ -672,6 +976,7 @@ def solve_maximum_clique_clisat(graph: nx.Graph, time_limit: float = 3600.0,
         time_limit: Tempo limite em segundos (default: 1 hora)
         log_interval: Intervalo de nós para logs periódicos
         time_interval: Intervalo de tempo para logs periódicos (segundos)
+        n_workers: Processos para a busca paralela na raiz (1 = sequencial)
         
     Returns:
         Tuple contendo (lista_de_nós_do_clique, tamanho_do_clique, estatísticas_dict)
@@ -679,7 +984,7 @@ def solve_maximum_clique_clisat(graph: nx.Graph, time_limit: float = 3600.0,
         e outras estatísticas do algoritmo
     """
     start_time = time.time()
-    solver = CliSAT(graph, time_limit, log_interval, time_interval)
+    solver = CliSAT(graph, time_limit, log_interval, time_interval, n_workers)
     clique, size = solver.solve()
     execution_time = time.time() - start_time
     
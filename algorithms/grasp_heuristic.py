@@ -25,16 +25,35 @@ Data: Julho 2025
 """
 
 import networkx as nx
-import random
+import os
+import sys
 import time
 import logging
-from typing import List, Set, Tuple, Optional, Dict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, FrozenSet, List, Set, Tuple, Optional, Dict
 import numpy as np
 from dataclasses import dataclass
+from functools import cached_property
+
+try:
+    from . import _fast
+    from .algorithm_interface import precompute_graph_data
+except ImportError:  # execução direta do módulo (python grasp_heuristic.py)
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from algorithms import _fast
+    from algorithms.algorithm_interface import precompute_graph_data
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_bits(mask: int):
+    """Iterar os índices dos bits ligados de uma máscara, em ordem crescente."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
 @dataclass
 class GRASPParameters:
     """Parâmetros de configuração do GRASP."""
@@ -44,6 +63,7 @@ class GRASPParameters:
     max_no_improvement: int = 100    # Máximo de iterações sem melhoria
     local_search_intensity: int = 3  # Intensidade da busca local
     seed: Optional[int] = None       # Semente para reprodutibilidade
+    n_workers: int = 1               # Processos para iterações em paralelo (1 = sequencial)
 
 
 @dataclass
@@ -55,11 +75,12 @@ class GRASPStatistics:
     total_time: float = 0.0
     best_iteration: int = 0
     improvements_found: int = 0
-    clique_sizes_history: List[int] = None
+    proven_optimal: bool = False     # Melhor clique igual ao limite da coloração
+    clique_sizes_history: np.ndarray = None  # Tamanho por iteração (int32, preenchido até total_iterations)
     
     def __post_init__(self):
         if self.clique_sizes_history is None:
-            self.clique_sizes_history = []
+            self.clique_sizes_history = np.zeros(0, dtype=np.int32)
 
 
 class GRASPMaximumClique:
@@ -82,27 +103,92 @@ class GRASPMaximumClique:
         """
         self.graph = graph
         self.params = params or GRASPParameters()
-        self.stats = GRASPStatistics()
+        self.stats = GRASPStatistics(
+            clique_sizes_history=np.zeros(self.params.max_iterations, dtype=np.int32))
         
-        # Configurar semente aleatória
-        if self.params.seed is not None:
-            random.seed(self.params.seed)
-            np.random.seed(self.params.seed)
+        # Gerador próprio (PCG64) em vez do estado global de random/np.random:
+        # cada instância, e cada iteração paralela, tem seu fluxo independente
+        self.rng = np.random.default_rng(self.params.seed)
+        self._seed_sequence = np.random.SeedSequence(self.params.seed)
         
         # Melhor solução encontrada
         self.best_clique = []
         self.best_clique_size = 0
         
-        # Pré-computar informações do grafo
-        self.nodes = list(self.graph.nodes())
+        # Pré-computar informações do grafo. A matriz de bits (uint64, n x
+        # palavras) vem das estruturas compartilhadas por grafo, sem cópia
+        # própria quando outros algoritmos já rodaram sobre o mesmo grafo
+        graph_data = precompute_graph_data(self.graph)
+        self.nodes = graph_data.nodes
         self.n_nodes = len(self.nodes)
-        self.adjacency_dict = {node: set(self.graph.neighbors(node)) for node in self.nodes}
+        self.node_index = graph_data.node_index
+        
+        # Vizinhanças como bitsets (int Python) sobre índices contíguos:
+        # o bit j de adj_bits[i] indica a aresta (nodes[i], nodes[j]).
+        # Laços são descartados: um vértice não é candidato a seguir a si mesmo
+        adj_words = graph_data.adj_bits
+        self.adj_bits = [int.from_bytes(row.tobytes(), 'little') & ~(1 << i)
+                         for i, row in enumerate(adj_words)]
+        self.all_mask = (1 << self.n_nodes) - 1
+        
+        # Área para os sorteios de cada construção
+        self._draws = np.empty(self.n_nodes)
+        
+        # Graus no grafo inteiro: a função gulosa do primeiro passo da
+        # construção, quando todos os vértices são candidatos
+        self.degrees = [mask.bit_count() for mask in self.adj_bits]
+        
+        # Com Numba, construção, expansão e validação rodam nos kernels de
+        # _fast sobre as mesmas vizinhanças empacotadas em palavras uint64
+        self.adj_words = None
+        if _fast.NUMBA_AVAILABLE:
+            if nx.number_of_selfloops(self.graph):
+                n_bytes = adj_words.shape[1] * 8
+                adj_words = np.frombuffer(
+                    b''.join(mask.to_bytes(n_bytes, 'little') for mask in self.adj_bits),
+                    dtype=np.uint64).reshape(adj_words.shape)
+            self.adj_words = adj_words
+            self._degree_array = np.array(self.degrees, dtype=np.int32)
+            # Áreas de trabalho dos kernels, alocadas uma vez por instância
+            self._construction_work = np.empty((3, self.n_nodes), dtype=np.int32)
+            self._expansion_out = np.empty(self.n_nodes, dtype=np.int32)
         
         # Estimativa de tempo para timeout
         self.timeout_estimate = None
         
         logger.info(f"GRASP inicializado: {self.n_nodes} nós")
 
+    @cached_property
+    def adjacency_dict(self) -> Dict[Any, FrozenSet[Any]]:
+        """
+        Vizinhanças por rótulo de vértice (conjuntos imutáveis).
+        
+        O algoritmo usa adj_bits; o dicionário só é montado, uma vez, se
+        for consultado.
+        """
+        graph_adj = self.graph._adj
+        return {node: frozenset(graph_adj[node]) for node in self.nodes}
+
+    @cached_property
+    def upper_bound(self) -> int:
+        """
+        Limite superior para o clique máximo: número de cores de uma
+        coloração gulosa (first-fit, vértices em ordem decrescente de grau).
+        
+        Calculado na primeira consulta, com O(n · cores) ANDs de bitsets
+        (nx.greedy_color com DSATUR leva segundos a minutos em grafos densos).
+        """
+        classes = []
+        for v in sorted(range(self.n_nodes), key=self.degrees.__getitem__, reverse=True):
+            neighbors = self.adj_bits[v]
+            for i, members in enumerate(classes):
+                if not members & neighbors:
+                    classes[i] = members | (1 << v)
+                    break
+            else:
+                classes.append(1 << v)
+        return len(classes)
+
     def solve(self) -> Tuple[List[int], int, float]:
         """
         Executar o algoritmo GRASP principal.
@@ -115,56 +201,15 @@ class GRASPMaximumClique:
         print("\n🚀 INICIANDO GRASP")
         print(f"   Grafo: {self.n_nodes} vértices, {len(self.graph.edges())} arestas")
         
-        # Variáveis de controle
-        iteration = 0
-        last_improvement = 0
-        
         try:
-            while self._should_continue(iteration, start_time, last_improvement):
-                iteration += 1
-                
-                # Fase 1: Construção Gulosa Randomizada
-                construction_start = time.time()
-                current_clique = self._greedy_randomized_construction()
-                construction_time = time.time() - construction_start
-                self.stats.construction_time += construction_time
-                
-                # Fase 2: Busca Local
-                local_search_start = time.time()
-                improved_clique = self._local_search(current_clique)
-                local_search_time = time.time() - local_search_start
-                self.stats.local_search_time += local_search_time
-                
-                # Atualizar melhor solução
-                if len(improved_clique) > self.best_clique_size:
-                    self.best_clique = improved_clique.copy()
-                    self.best_clique_size = len(improved_clique)
-                    self.stats.best_iteration = iteration
-                    self.stats.improvements_found += 1
-                    last_improvement = iteration
-                    
-                    elapsed = time.time() - start_time
-                    hours = int(elapsed // 3600)
-                    minutes = int((elapsed % 3600) // 60)
-                    seconds = int(elapsed % 60)
-                    print(f"🎯 Novo melhor: {self.best_clique_size} vértices ({hours:02d}:{minutes:02d}:{seconds:02d})")
-                
-                # Registrar estatísticas
-                self.stats.clique_sizes_history.append(len(improved_clique))
-                
-                # Log periódico
-                if iteration % 100 == 0:
-                    elapsed = time.time() - start_time
-                    hours = int(elapsed // 3600)
-                    minutes = int((elapsed % 3600) // 60)
-                    seconds = int(elapsed % 60)
-                    print(f"� Progresso: {iteration}/{self.params.max_iterations} - Melhor: {self.best_clique_size} ({hours:02d}:{minutes:02d}:{seconds:02d})")
-        
+            if self.params.n_workers > 1:
+                self._solve_parallel(start_time)
+            else:
+                self._solve_sequential(start_time)
         except KeyboardInterrupt:
             print("\n⏹️  GRASP interrompido pelo usuário")
         
-        # Finalizar estatísticas
-        self.stats.total_iterations = iteration
+        # Finalizar estatísticas (total_iterations é mantido por _record_iteration)
         self.stats.total_time = time.time() - start_time
         
         print(f"\n🏁 GRASP FINALIZADO!")
@@ -173,6 +218,150 @@ class GRASPMaximumClique:
         
         return self.best_clique, self.best_clique_size, self.stats.total_time
 
+    def _solve_sequential(self, start_time: float) -> int:
+        """
+        Executar as iterações do GRASP no processo atual.
+        
+        Args:
+            start_time: Início da execução
+            
+        Returns:
+            Número de iterações executadas
+        """
+        iteration = 0
+        last_improvement = 0
+        
+        while self._should_continue(iteration, start_time, last_improvement):
+            iteration += 1
+            improved_clique, construction_time, local_search_time = self._iterate()
+            if self._record_iteration(iteration, improved_clique, construction_time,
+                                      local_search_time, start_time):
+                last_improvement = iteration
+        
+        return iteration
+
+    def _solve_parallel(self, start_time: float) -> int:
+        """
+        Executar as iterações do GRASP em processos separados (multistart).
+        
+        As iterações são independentes: cada uma recebe apenas uma semente
+        derivada (SeedSequence.spawn) da semente da execução, e o worker
+        devolve o clique da sua busca local. O grafo é enviado uma única vez por worker. Até
+        2 * n_workers iterações ficam em andamento; os critérios de parada são
+        avaliados a cada iteração concluída.
+        
+        Args:
+            start_time: Início da execução
+            
+        Returns:
+            Número de iterações concluídas
+        """
+        n_workers = self.params.n_workers
+        iteration = 0
+        last_improvement = 0
+        submitted = 0
+        pending = set()
+        
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_grasp_worker,
+                                 initargs=(self.graph, self.params)) as pool:
+            while True:
+                while len(pending) < 2 * n_workers and submitted < self.params.max_iterations:
+                    pending.add(pool.submit(_run_grasp_iteration, self._seed_sequence.spawn(1)[0]))
+                    submitted += 1
+                if not pending:
+                    break
+                
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    iteration += 1
+                    improved_clique, construction_time, local_search_time = future.result()
+                    if self._record_iteration(iteration, improved_clique, construction_time,
+                                              local_search_time, start_time):
+                        last_improvement = iteration
+                
+                if not self._should_continue(iteration, start_time, last_improvement):
+                    for future in pending:
+                        future.cancel()
+                    break
+        
+        return iteration
+
+    def _iterate(self) -> Tuple[int, float, float]:
+        """
+        Executar uma iteração do GRASP (construção seguida de busca local).
+        
+        As duas fases compartilham o clique como máscara de bits, junto com
+        seus vizinhos comuns; a conversão para rótulos só ocorre quando a
+        iteração melhora a solução (_record_iteration).
+        
+        Returns:
+            Tupla (máscara do clique após a busca local, tempo de construção,
+            tempo de busca local)
+        """
+        # Fase 1: Construção Gulosa Randomizada
+        construction_start = time.time()
+        current_clique = self._greedy_randomized_construction()
+        construction_time = time.time() - construction_start
+        
+        # Fase 2: Busca Local. A construção só para quando não restam
+        # candidatos, então o clique construído não tem vizinhos comuns
+        local_search_start = time.time()
+        improved_clique = self._local_search(current_clique, common=0)
+        local_search_time = time.time() - local_search_start
+        
+        return improved_clique, construction_time, local_search_time
+
+    def _record_iteration(self, iteration: int, improved_clique: int,
+                          construction_time: float, local_search_time: float,
+                          start_time: float) -> bool:
+        """
+        Registrar o resultado de uma iteração e atualizar a melhor solução.
+        
+        Args:
+            iteration: Número da iteração
+            improved_clique: Máscara do clique obtido na iteração
+            construction_time: Tempo da fase de construção
+            local_search_time: Tempo da busca local
+            start_time: Início da execução
+            
+        Returns:
+            True se a iteração encontrou uma solução melhor
+        """
+        self.stats.construction_time += construction_time
+        self.stats.local_search_time += local_search_time
+        
+        # Atualizar melhor solução
+        clique_size = improved_clique.bit_count()
+        improved = clique_size > self.best_clique_size
+        if improved:
+            # Verificação de sanidade (apenas em modo de depuração)
+            assert self._is_valid_clique_mask(improved_clique)
+            self.best_clique = [self.nodes[i] for i in _iter_bits(improved_clique)]
+            self.best_clique_size = clique_size
+            self.stats.best_iteration = iteration
+            self.stats.improvements_found += 1
+            
+            elapsed = time.time() - start_time
+            hours = int(elapsed // 3600)
+            minutes = int((elapsed % 3600) // 60)
+            seconds = int(elapsed % 60)
+            print(f"🎯 Novo melhor: {self.best_clique_size} vértices ({hours:02d}:{minutes:02d}:{seconds:02d})")
+        
+        # Registrar estatísticas
+        self.stats.clique_sizes_history[iteration - 1] = clique_size
+        self.stats.total_iterations = iteration
+        
+        # Log periódico
+        if iteration % 100 == 0:
+            elapsed = time.time() - start_time
+            hours = int(elapsed // 3600)
+            minutes = int((elapsed % 3600) // 60)
+            seconds = int(elapsed % 60)
+            print(f"� Progresso: {iteration}/{self.params.max_iterations} - Melhor: {self.best_clique_size} ({hours:02d}:{minutes:02d}:{seconds:02d})")
+        
+        return improved
+
     def _should_continue(self, iteration: int, start_time: float, last_improvement: int) -> bool:
         """
         Verificar critérios de parada do GRASP.
@@ -185,6 +374,12 @@ class GRASPMaximumClique:
         Returns:
             True se deve continuar, False caso contrário
         """
+        # Ótimo comprovado: clique do tamanho do limite da coloração
+        if self.best_clique_size >= self.upper_bound:
+            self.stats.proven_optimal = True
+            print(f"✅ Ótimo comprovado pelo limite da coloração ({self.upper_bound})")
+            return False
+        
         # Limite de iterações
         if iteration >= self.params.max_iterations:
             return False
@@ -200,7 +395,7 @@ class GRASPMaximumClique:
                 current_time=current_time,
                 max_iterations=self.params.max_iterations,
                 best_clique_size=self.best_clique_size,
-                improvement_history=self.stats.clique_sizes_history
+                improvement_history=self.stats.clique_sizes_history[:iteration]
             )
             
             print(TimeoutEstimator.format_time_estimate(estimate))
@@ -216,86 +411,68 @@ class GRASPMaximumClique:
         
         return True
 
-    def _greedy_randomized_construction(self) -> List[int]:
+    def _greedy_randomized_construction(self) -> int:
         """
         Fase de Construção Gulosa Randomizada do GRASP.
         
         Constrói um clique usando uma Lista de Candidatos Restrita (RCL)
-        baseada no grau dos vértices candidatos.
+        baseada no grau dos vértices candidatos. Os candidatos são mantidos
+        como máscara de bits dos vértices adjacentes a todo o clique atual.
         
         Returns:
-            Lista de vértices do clique construído
+            Máscara de bits do clique construído
         """
-        clique = []
-        candidates = set(self.nodes)
+        # Uniformes para a escolha na RCL, um por passo
+        draws = self.rng.random(out=self._draws)
+        
+        if self.adj_words is not None:
+            return self._to_mask(_fast.grasp_construction(self.adj_words, self._degree_array,
+                                                          self.params.alpha, draws,
+                                                          self._construction_work).tolist())
+        
+        clique = 0
+        candidates = self.all_mask
+        step = 0
         
         while candidates:
-            # Calcular candidatos válidos (que mantêm a propriedade de clique)
-            valid_candidates = []
-            if not clique:
-                # Primeiro vértice: todos são válidos
-                valid_candidates = list(candidates)
-            else:
-                # Vértices que são adjacentes a todos no clique atual
-                for candidate in candidates:
-                    if all(candidate in self.adjacency_dict[v] for v in clique):
-                        valid_candidates.append(candidate)
-            
-            if not valid_candidates:
-                break
-            
-            # Construir RCL baseada no grau dos candidatos
-            rcl = self._build_restricted_candidate_list(valid_candidates, clique)
+            # Selecionar aleatoriamente da RCL baseada no grau dos candidatos
+            selected = self._select_from_rcl(candidates, draws[step])
+            step += 1
             
-            if not rcl:
-                break
-            
-            # Selecionar aleatoriamente da RCL
-            selected = random.choice(rcl)
-            
-            # Adicionar ao clique e atualizar candidatos
-            clique.append(selected)
-            candidates.remove(selected)
-            
-            # Atualizar candidatos: manter apenas os adjacentes ao vértice selecionado
-            candidates &= self.adjacency_dict[selected]
+            # Adicionar ao clique e manter apenas os candidatos adjacentes
+            # ao vértice selecionado (o próprio não é vizinho de si)
+            clique |= 1 << selected
+            candidates &= self.adj_bits[selected]
         
         return clique
 
-    def _build_restricted_candidate_list(self, candidates: List[int], current_clique: List[int]) -> List[int]:
+    def _select_from_rcl(self, candidates: int, draw: float) -> int:
         """
-        Construir Lista de Candidatos Restrita (RCL) para o GRASP.
+        Sortear um vértice da Lista de Candidatos Restrita (RCL) do GRASP.
         
         A RCL contém os candidatos com melhor valor da função gulosa,
-        controlado pelo parâmetro α.
+        controlado pelo parâmetro α. Ela não é materializada: uma passada
+        conta seus membros e outra localiza o sorteado.
         
         Args:
-            candidates: Lista de candidatos válidos
-            current_clique: Clique atual em construção
+            candidates: Máscara de bits dos candidatos válidos (não vazia)
+            draw: Uniforme em [0, 1) que define a posição sorteada na RCL
             
         Returns:
-            Lista de candidatos na RCL
+            Índice do vértice selecionado
         """
-        if not candidates:
-            return []
-        
-        # Função gulosa: grau do vértice entre os candidatos
-        candidate_degrees = []
-        for candidate in candidates:
-            # Grau entre os candidatos válidos
-            degree = sum(1 for other in candidates 
-                        if other != candidate and candidate in self.adjacency_dict[other])
-            candidate_degrees.append((candidate, degree))
-        
-        # Ordenar por grau (decrescente)
-        candidate_degrees.sort(key=lambda x: x[1], reverse=True)
-        
-        if not candidate_degrees:
-            return candidates
+        # Função gulosa: grau do vértice entre os candidatos válidos
+        if candidates == self.all_mask:
+            candidate_list = range(self.n_nodes)
+            degrees = self.degrees
+        else:
+            adj_bits = self.adj_bits
+            candidate_list = list(_iter_bits(candidates))
+            degrees = [(adj_bits[candidate] & candidates).bit_count() for candidate in candidate_list]
         
-        # Calcular limites da RCL
-        best_value = candidate_degrees[0][1]
-        worst_value = candidate_degrees[-1][1]
+        # Calcular limites da RCL (sem ordenar: basta o maior e o menor grau)
+        best_value = max(degrees)
+        worst_value = min(degrees)
         
         # Evitar divisão por zero
         if best_value == worst_value:
@@ -303,12 +480,16 @@ class GRASPMaximumClique:
         else:
             threshold = worst_value + self.params.alpha * (best_value - worst_value)
         
-        # Construir RCL
-        rcl = [candidate for candidate, degree in candidate_degrees if degree >= threshold]
-        
-        return rcl
+        # Sortear a posição na RCL e localizá-la entre os candidatos
+        rcl_size = sum(1 for degree in degrees if degree >= threshold)
+        target = min(int(draw * rcl_size), rcl_size - 1)
+        for candidate, degree in zip(candidate_list, degrees):
+            if degree >= threshold:
+                if target == 0:
+                    return candidate
+                target -= 1
 
-    def _local_search(self, initial_clique: List[int]) -> List[int]:
+    def _local_search(self, initial_clique: int, common: Optional[int] = None) -> int:
         """
         Fase de Busca Local do GRASP.
         
@@ -318,12 +499,17 @@ class GRASPMaximumClique:
         3. SWAP: Trocar vértice do clique por outro
         
         Args:
-            initial_clique: Clique inicial
+            initial_clique: Clique inicial (máscara de bits)
+            common: Vizinhos comuns do clique inicial, se já conhecidos
             
         Returns:
-            Clique melhorado
+            Clique melhorado (máscara de bits)
         """
-        current_clique = initial_clique.copy()
+        current_clique = initial_clique
+        current_size = current_clique.bit_count()
+        # Vizinhos comuns do clique atual: exatamente os candidatos do ADD
+        if common is None:
+            common = self._common_neighbors(current_clique)
         improvement_found = True
         
         intensity = 0
@@ -331,143 +517,187 @@ class GRASPMaximumClique:
             improvement_found = False
             intensity += 1
             
-            # Operador ADD: tentar adicionar vértices
-            improved_clique = self._local_search_add(current_clique)
-            if len(improved_clique) > len(current_clique):
+            # Operador ADD: tentar adicionar vértices (atualização incremental
+            # dos vizinhos comuns)
+            improved_clique = self._local_search_add(current_clique, common)
+            if improved_clique != current_clique:
+                common &= self.adj_bits[(improved_clique ^ current_clique).bit_length() - 1]
                 current_clique = improved_clique
+                current_size += 1
                 improvement_found = True
                 continue
             
             # Operador SWAP: trocar vértices
             improved_clique = self._local_search_swap(current_clique)
-            if len(improved_clique) > len(current_clique):
+            if improved_clique.bit_count() > current_size:
                 current_clique = improved_clique
+                current_size = improved_clique.bit_count()
+                common = self._common_neighbors(current_clique)
                 improvement_found = True
                 continue
             
             # Operador REMOVE-ADD: remover um e tentar adicionar outros
             improved_clique = self._local_search_remove_add(current_clique)
-            if len(improved_clique) > len(current_clique):
+            if improved_clique.bit_count() > current_size:
                 current_clique = improved_clique
+                current_size = improved_clique.bit_count()
+                common = self._common_neighbors(current_clique)
                 improvement_found = True
         
         return current_clique
 
-    def _local_search_add(self, clique: List[int]) -> List[int]:
+    def _local_search_add(self, clique: int, common: int) -> int:
         """
         Operador ADD: tentar adicionar vértices ao clique.
         
         Args:
-            clique: Clique atual
+            clique: Clique atual (máscara de bits)
+            common: Vértices adjacentes a todo o clique (máscara de bits)
             
         Returns:
             Clique possivelmente expandido
         """
-        clique_set = set(clique)
-        candidates = set(self.nodes) - clique_set
-        
-        for candidate in candidates:
-            # Verificar se candidate é adjacente a todos no clique
-            if all(candidate in self.adjacency_dict[v] for v in clique):
-                return clique + [candidate]
+        if common:
+            return clique | (common & -common)
         
         return clique
 
-    def _local_search_swap(self, clique: List[int]) -> List[int]:
+    def _local_search_swap(self, clique: int) -> int:
         """
         Operador SWAP: trocar um vértice do clique por outro.
         
         Args:
-            clique: Clique atual
+            clique: Clique atual (máscara de bits)
             
         Returns:
             Clique possivelmente melhorado
         """
-        if len(clique) <= 1:
+        if clique.bit_count() <= 1:
             return clique
         
-        clique_set = set(clique)
-        non_clique = set(self.nodes) - clique_set
-        
-        for v_out in clique:
-            for v_in in non_clique:
-                # Tentar trocar v_out por v_in
-                new_clique = [v if v != v_out else v_in for v in clique]
-                if self._is_valid_clique(new_clique):
-                    return new_clique
+        # v_in precisa ser adjacente a todos os vértices que permanecem
+        vertices = list(_iter_bits(clique))
+        for v_out, without in zip(vertices, self._common_neighbors_without_each(vertices)):
+            swap_in = without & ~clique
+            if swap_in:
+                return clique ^ (1 << v_out) | (swap_in & -swap_in)
         
         return clique
 
-    def _local_search_remove_add(self, clique: List[int]) -> List[int]:
+    def _local_search_remove_add(self, clique: int) -> int:
         """
         Operador REMOVE-ADD: remover um vértice e tentar adicionar múltiplos.
         
         Args:
-            clique: Clique atual
+            clique: Clique atual (máscara de bits)
             
         Returns:
             Clique possivelmente melhorado
         """
-        if len(clique) <= 1:
+        if clique.bit_count() <= 1:
             return clique
         
         best_clique = clique
-        
-        for v_remove in clique:
-            # Remover vértice
-            reduced_clique = [v for v in clique if v != v_remove]
+        best_size = clique.bit_count()
+        
+        vertices = list(_iter_bits(clique))
+        without_each = self._common_neighbors_without_each(vertices)
+        full = without_each[0] & self.adj_bits[vertices[0]]
+        
+        for v_remove, without in zip(vertices, without_each):
+            # Com o clique maximal (full vazio), remover v_remove só libera os
+            # vértices de enabled, nenhum vizinho de v_remove: a expansão só
+            # supera o clique se dois deles forem adjacentes
+            enabled = without & ~full & ~clique
+            if not full and not any(self.adj_bits[v] & enabled for v in _iter_bits(enabled)):
+                continue
             
-            # Tentar adicionar vértices ao clique reduzido
-            expanded_clique = self._greedy_expansion(reduced_clique)
+            # Remover vértice e tentar adicionar vértices ao clique reduzido
+            expanded_clique = self._greedy_expansion(clique ^ (1 << v_remove))
             
-            if len(expanded_clique) > len(best_clique):
+            if expanded_clique.bit_count() > best_size:
                 best_clique = expanded_clique
+                best_size = expanded_clique.bit_count()
         
         return best_clique
 
-    def _greedy_expansion(self, clique: List[int]) -> List[int]:
+    def _greedy_expansion(self, clique: int) -> int:
         """
         Expansão gulosa: adicionar vértices greedily.
         
         Args:
-            clique: Clique inicial
+            clique: Clique inicial (máscara de bits)
             
         Returns:
-            Clique expandido
+            Clique expandido (máscara de bits)
         """
-        current_clique = clique.copy()
-        clique_set = set(current_clique)
-        
-        improvement = True
-        while improvement:
-            improvement = False
-            candidates = set(self.nodes) - clique_set
-            
-            # Encontrar candidato com maior grau entre os candidatos
-            best_candidate = None
-            best_degree = -1
+        if self.adj_words is not None:
+            clique_idx = np.fromiter(_iter_bits(clique), dtype=np.int32)
+            return self._to_mask(_fast.greedy_expansion_bits(self.adj_words, self._degree_array,
+                                                             clique_idx, self._expansion_out).tolist())
+        
+        # Candidatos viáveis: adjacentes a todos os vértices do clique
+        feasible = self._common_neighbors(clique)
+        
+        while feasible:
+            # Candidato viável com maior grau entre os vértices fora do clique.
+            # Como é vizinho de todo o clique, esse grau é o grau no grafo
+            # menos o tamanho do clique: basta comparar self.degrees
+            best_candidate = max(_iter_bits(feasible), key=self.degrees.__getitem__)
             
-            for candidate in candidates:
-                if all(candidate in self.adjacency_dict[v] for v in current_clique):
-                    degree = sum(1 for other in candidates 
-                               if other != candidate and candidate in self.adjacency_dict[other])
-                    if degree > best_degree:
-                        best_degree = degree
-                        best_candidate = candidate
-            
-            if best_candidate is not None:
-                current_clique.append(best_candidate)
-                clique_set.add(best_candidate)
-                improvement = True
+            clique |= 1 << best_candidate
+            feasible &= self.adj_bits[best_candidate]
         
-        return current_clique
+        return clique
+
+    def _common_neighbors(self, clique: int) -> int:
+        """Vértices adjacentes a todos os vértices do clique (máscara de bits)."""
+        common = self.all_mask
+        for v in _iter_bits(clique):
+            common &= self.adj_bits[v]
+        return common
+
+    def _common_neighbors_without_each(self, vertices: List[int]) -> List[int]:
+        """
+        Vizinhos comuns do clique sem cada um de seus vértices.
+        
+        Usa ANDs de prefixo e sufixo: o i-ésimo resultado é
+        pre[i] & suf[i], com O(k) ANDs no total em vez de O(k²).
+        
+        Args:
+            vertices: Índices dos vértices do clique
+            
+        Returns:
+            Lista com, para cada vértice i, a interseção das vizinhanças dos
+            demais vértices (máscara de bits)
+        """
+        adj_bits = self.adj_bits
+        k = len(vertices)
+        
+        prefix = [self.all_mask] * (k + 1)
+        for i, v in enumerate(vertices):
+            prefix[i + 1] = prefix[i] & adj_bits[v]
+        
+        result = [0] * k
+        suffix = self.all_mask
+        for i in range(k - 1, -1, -1):
+            result[i] = prefix[i] & suffix
+            suffix &= adj_bits[vertices[i]]
+        return result
+
+    def _to_mask(self, vertices: List[int]) -> int:
+        """Converter uma lista de índices de vértices em máscara de bits."""
+        mask = 0
+        for v in vertices:
+            mask |= 1 << v
+        return mask
 
     def _is_valid_clique(self, vertices: List[int]) -> bool:
         """
         Verificar se um conjunto de vértices forma um clique válido.
         
         Args:
-            vertices: Lista de vértices
+            vertices: Lista de índices de vértices
             
         Returns:
             True se é um clique válido, False caso contrário
@@ -475,11 +705,29 @@ class GRASPMaximumClique:
         if len(vertices) <= 1:
             return True
         
-        for i in range(len(vertices)):
-            for j in range(i + 1, len(vertices)):
-                if vertices[j] not in self.adjacency_dict[vertices[i]]:
-                    return False
+        if self.adj_words is not None:
+            return _fast.validate_clique_bits(np.array(vertices, dtype=np.intp), self.adj_words)
+        
+        mask = self._to_mask(vertices)
+        return mask.bit_count() == len(vertices) and self._is_valid_clique_mask(mask)
+
+    def _is_valid_clique_mask(self, mask: int) -> bool:
+        """
+        Verificar se uma máscara de vértices forma um clique válido.
         
+        A interseção das vizinhanças fechadas dos vértices precisa conter a
+        própria máscara; a verificação para no primeiro vértice que exclui
+        algum membro.
+        
+        Args:
+            mask: Máscara de bits dos vértices
+            
+        Returns:
+            True se é um clique válido, False caso contrário
+        """
+        for v in _iter_bits(mask):
+            if mask & ~(self.adj_bits[v] | (1 << v)):
+                return False
         return True
 
     def get_statistics(self) -> Dict:
@@ -497,19 +745,44 @@ class GRASPMaximumClique:
             'best_iteration': self.stats.best_iteration,
             'improvements_found': self.stats.improvements_found,
             'best_clique_size': self.best_clique_size,
+            'proven_optimal': self.stats.proven_optimal,
             'alpha': self.params.alpha,
             'max_iterations': self.params.max_iterations,
-            'convergence_history': self.stats.clique_sizes_history.copy()
+            'convergence_history': self.stats.clique_sizes_history[:self.stats.total_iterations]
         }
 
 
+_WORKER_GRASP: Optional[GRASPMaximumClique] = None
+
+
+def _init_grasp_worker(graph: nx.Graph, params: GRASPParameters) -> None:
+    """Inicializar a instância local do GRASP de um processo worker."""
+    global _WORKER_GRASP
+    _WORKER_GRASP = GRASPMaximumClique(graph, params)
+
+
+def _run_grasp_iteration(seed: np.random.SeedSequence) -> Tuple[int, float, float]:
+    """
+    Executar uma iteração do GRASP em um processo worker.
+    
+    Args:
+        seed: Semente da iteração (derivada pelo processo principal)
+        
+    Returns:
+        Tupla (máscara do clique, tempo de construção, tempo de busca local)
+    """
+    _WORKER_GRASP.rng = np.random.default_rng(seed)
+    return _WORKER_GRASP._iterate()
+
+
 def solve_maximum_clique_grasp(graph: nx.Graph, 
                               alpha: float = 0.3,
                               max_iterations: int = 1000,
                               time_limit: float = 300.0,
                               max_no_improvement: int = 100,
                               seed: Optional[int] = None,
-                              return_stats: bool = False) -> Tuple[List[int], int, float, Optional[Dict]]:
+                              return_stats: bool = False,
+                              n_workers: int = 1) -> Tuple[List[int], int, float, Optional[Dict]]:
     """
     Interface principal para resolver o problema do clique máximo com GRASP.
     
@@ -521,6 +794,7 @@ def solve_maximum_clique_grasp(graph: nx.Graph,
         max_no_improvement: Máximo de iterações sem melhoria
         seed: Semente aleatória para reprodutibilidade
         return_stats: Se True, retorna estatísticas incluindo timeout_estimate
+        n_workers: Processos para executar as iterações em paralelo (1 = sequencial)
         
     Returns:
         Tupla (clique, tamanho, tempo_execução, stats_dict)
@@ -531,7 +805,8 @@ def solve_maximum_clique_grasp(graph: nx.Graph,
         max_iterations=max_iterations,
         time_limit=time_limit,
         max_no_improvement=max_no_improvement,
-        seed=seed
+        seed=seed,
+        n_workers=n_workers
     )
     
     grasp = GRASPMaximumClique(graph, params)
@@ -546,6 +821,7 @@ def solve_maximum_clique_grasp(graph: nx.Graph,
             'best_iteration': grasp.stats.best_iteration,
             'construction_time': grasp.stats.construction_time,
             'local_search_time': grasp.stats.local_search_time,
+            'proven_optimal': grasp.stats.proven_optimal,
         }
         
         # Adicionar timeout_estimate se foi gerada
@@ -7,7 +7,6 @@ https://iridia.ulb.ac.be/~fmascia/maximum_clique/
 """
 
 import os
-import requests
 import networkx as nx
 import gzip
 import shutil
@@ -125,6 +124,9 @@ class DIMACSLoader:
             logger.info(f"Grafo {graph_name} já existe localmente.")
             return True
         
+        # Import tardio: requests só é necessário quando há download
+        import requests
+        
         try:
             logger.info(f"Baixando {graph_name} de {url}...")
             response = requests.get(url, timeout=30)
@@ -32,16 +32,23 @@ class GraphUtils:
         n_nodes = len(graph.nodes())
         n_edges = len(graph.edges())
         
+        # Uma única varredura de componentes responde também a conectividade
+        n_components = nx.number_connected_components(graph)
+        
+        # Sequência de graus montada uma vez; min/max percorrem a lista em C
+        # (laços contam dois, como em graph.degree)
+        degrees = [len(nbrs) + (u in nbrs) for u, nbrs in graph._adj.items()]
+        
         analysis = {
             'nodes': n_nodes,
             'edges': n_edges,
             'density': nx.density(graph),
-            'is_connected': nx.is_connected(graph),
-            'number_of_components': nx.number_connected_components(graph),
+            'is_connected': n_components == 1,
+            'number_of_components': n_components,
             'average_clustering': nx.average_clustering(graph),
             'average_degree': 2 * n_edges / n_nodes if n_nodes > 0 else 0,
-            'max_degree': max(dict(graph.degree()).values()) if n_nodes > 0 else 0,
-            'min_degree': min(dict(graph.degree()).values()) if n_nodes > 0 else 0
+            'max_degree': max(degrees) if n_nodes > 0 else 0,
+            'min_degree': min(degrees) if n_nodes > 0 else 0
         }
         
         # Propriedades que requerem conectividade
@@ -76,17 +83,21 @@ class GraphUtils:
         if len(clique) <= 1:
             return True
         
+        # Consultas diretas ao dicionário de adjacência (sem has_edge por par)
+        adj = graph._adj
+        
         # Verificar se todos os vértices existem
         for vertex in clique:
-            if vertex not in graph:
+            if vertex not in adj:
                 logger.warning(f"Vértice {vertex} não existe no grafo")
                 return False
         
         # Verificar se todos os pares são adjacentes
-        for i in range(len(clique)):
-            for j in range(i + 1, len(clique)):
-                if not graph.has_edge(clique[i], clique[j]):
-                    logger.warning(f"Vértices {clique[i]} e {clique[j]} não são adjacentes")
+        for i, u in enumerate(clique):
+            neighbors = adj[u]
+            for v in clique[i + 1:]:
+                if v not in neighbors:
+                    logger.warning(f"Vértices {u} e {v} não são adjacentes")
                     return False
         
         return True
@@ -177,26 +188,29 @@ class GraphUtils:
             metrics['density'] = nx.density(graph)
             
             # Métricas de conectividade
-            metrics['is_connected'] = nx.is_connected(graph)
             metrics['components'] = nx.number_connected_components(graph)
+            metrics['is_connected'] = metrics['components'] == 1
             
-            # Métricas de grau
-            degrees = list(dict(graph.degree()).values())
-            metrics['avg_degree'] = np.mean(degrees) if degrees else 0
-            metrics['max_degree'] = np.max(degrees) if degrees else 0
-            metrics['min_degree'] = np.min(degrees) if degrees else 0
-            metrics['degree_std'] = np.std(degrees) if degrees else 0
+            # Métricas de grau, sobre um único vetor NumPy (laços contam dois)
+            n_nodes = metrics['nodes']
+            degrees = np.fromiter((len(nbrs) + (u in nbrs) for u, nbrs in graph._adj.items()),
+                                  dtype=np.int64, count=n_nodes)
+            metrics['avg_degree'] = degrees.mean() if n_nodes else 0
+            metrics['max_degree'] = degrees.max() if n_nodes else 0
+            metrics['min_degree'] = degrees.min() if n_nodes else 0
+            metrics['degree_std'] = degrees.std() if n_nodes else 0
             
             # Métricas de clustering
             metrics['avg_clustering'] = nx.average_clustering(graph)
             metrics['transitivity'] = nx.transitivity(graph)
             
             # Métricas de centralidade (para grafos pequenos)
-            if len(graph.nodes()) <= 1000:
+            # (centralidade de grau = grau / (n - 1), derivada do mesmo vetor)
+            if n_nodes <= 1000:
                 try:
-                    centralities = nx.degree_centrality(graph)
-                    metrics['max_centrality'] = max(centralities.values()) if centralities else 0
-                    metrics['avg_centrality'] = np.mean(list(centralities.values())) if centralities else 0
+                    centralities = degrees / max(n_nodes - 1, 1)
+                    metrics['max_centrality'] = float(centralities.max())
+                    metrics['avg_centrality'] = float(centralities.mean())
                 except:
                     metrics['max_centrality'] = 0
                     metrics['avg_centrality'] = 0
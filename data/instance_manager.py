@@ -6,15 +6,125 @@ para a disciplina de Análise e Projeto de Algoritmos do mestrado.
 """
 
 import os
-import requests
+import re
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import networkx as nx
 from typing import List, Dict, Optional, Tuple
 import logging
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Tipos das colunas de instances_apa.csv (evita a inferência do pandas)
+INSTANCES_DTYPES = {
+    'Instance': 'string',
+    'Nodes': 'int32',
+    'Edges': 'int32',
+    'link': 'string',
+}
+
+# Valores ótimos conhecidos das instâncias DIMACS (somente leitura)
+KNOWN_OPTIMA = MappingProxyType({
+    'C125.9': 34,
+    'C250.9': 44,
+    'C500.9': 57,
+    'C1000.9': 68,
+    'C2000.9': 80,
+    'C2000.5': 16,
+    'C4000.5': 18,
+    'DSJC500_5': 13,
+    'DSJC1000_5': 15,
+    'MANN_a27': 126,
+    'MANN_a45': 345,
+    'MANN_a81': 1100,
+    'brock200_2': 12,
+    'brock200_4': 17,
+    'brock400_2': 29,
+    'brock400_4': 33,
+    'brock800_2': 24,
+    'brock800_4': 26,
+    'gen200_p0.9_44': 44,
+    'gen200_p0.9_55': 55,
+    'gen400_p0.9_55': 55,
+    'gen400_p0.9_65': 65,
+    'gen400_p0.9_75': 75,
+    'hamming8-4': 16,
+    'hamming10-4': 40,
+    'keller4': 11,
+    'keller5': 27,
+    'keller6': 59,
+    'p_hat300-1': 8,
+    'p_hat300-2': 25,
+    'p_hat300-3': 36,
+    'p_hat700-1': 11,
+    'p_hat700-2': 44,
+    'p_hat700-3': 62,
+    'p_hat1500-1': 12,
+    'p_hat1500-2': 65,
+    'p_hat1500-3': 94,
+})
+
+# Grafos DIMACS mantidos em memória (instâncias grandes ocupam centenas de MB)
+GRAPH_CACHE_SIZE = 4
+
+# Limites superiores (inclusivos) de nós de cada categoria de tamanho
+SIZE_LIMITS = np.array([200, 500, 1000])
+SIZE_CATEGORIES = np.array(['Pequeno', 'Médio', 'Grande', 'Muito Grande'], dtype=object)
+
+# Tabela já lida por processo, indexada por (caminho, mtime)
+_instances_cache: Dict[Tuple[str, int], pd.DataFrame] = {}
+
+
+def _read_instances_table(csv_path: Path) -> pd.DataFrame:
+    """
+    Ler a tabela de instâncias, reaproveitando a leitura anterior.
+
+    Vários gerenciadores são criados na mesma sessão (gerador de resultados,
+    scripts de execução); o CSV só é analisado de novo se for modificado.
+
+    Args:
+        csv_path: Caminho para instances_apa.csv
+
+    Returns:
+        DataFrame com as instâncias (não deve ser modificado in-place)
+    """
+    key = (str(csv_path), csv_path.stat().st_mtime_ns)
+    df = _instances_cache.get(key)
+    if df is None:
+        df = pd.read_csv(csv_path, dtype=INSTANCES_DTYPES,
+                         na_values=['N/A', ''], engine='c')
+        _add_derived_columns(df)
+        _instances_cache.clear()
+        _instances_cache[key] = df
+    return df
+
+
+# Prefixos das famílias DIMACS; nomes fora da lista caem em 'other'
+FAMILY_PATTERN = re.compile(r'^(C|DSJC|MANN|brock|gen|hamming|keller|p_hat)')
+FAMILY_NAMES = {'C': 'C-family'}
+
+
+def _add_derived_columns(df: pd.DataFrame) -> None:
+    """
+    Acrescentar Density, Size_Category e Family em uma única passagem.
+
+    Args:
+        df: Tabela de instâncias recém-lida (modificada in-place)
+    """
+    n = df['Nodes'].to_numpy(dtype=np.int64)
+    e = df['Edges'].to_numpy(dtype=np.int64)
+    df['Density'] = (2.0 * e) / (n * (n - 1))
+    
+    # Categoria de tamanho (≤200, ≤500, ≤1000, maior)
+    df['Size_Category'] = SIZE_CATEGORIES[np.digitize(n, SIZE_LIMITS, right=True)]
+    
+    # Família pelo prefixo, em uma passagem de regex; categórica para groupby
+    family = df['Instance'].str.extract(FAMILY_PATTERN, expand=False)
+    df['Family'] = family.replace(FAMILY_NAMES).fillna('other').astype('category')
+
 
 class APAInstanceManager:
     """Gerenciador para as instâncias específicas da atividade APA."""
@@ -28,21 +138,24 @@ class APAInstanceManager:
         Args:
             data_dir: Diretório para armazenar os arquivos DIMACS
         """
+        # Diretório e tabela de instâncias são criados/lidos sob demanda
         self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(exist_ok=True)
-        
-        # Carregar lista de instâncias
-        csv_path = Path(__file__).parent / "instances_apa.csv"
-        self.instances_df = pd.read_csv(csv_path)
-        
-        # Criar dicionário para acesso rápido
-        self.instances_info = {}
-        for _, row in self.instances_df.iterrows():
-            self.instances_info[row['Instance']] = {
-                'nodes': row['Nodes'],
-                'edges': row['Edges'],
-                'density': (2 * row['Edges']) / (row['Nodes'] * (row['Nodes'] - 1))
-            }
+        self._statistics: Optional[pd.DataFrame] = None
+    
+    @cached_property
+    def instances_df(self) -> pd.DataFrame:
+        """Tabela de instâncias APA, lida no primeiro acesso."""
+        return _read_instances_table(Path(__file__).parent / "instances_apa.csv")
+    
+    @cached_property
+    def instances_info(self) -> Dict[str, Dict]:
+        """Dicionário nome -> nós, arestas e densidade para acesso rápido."""
+        df = self.instances_df
+        return {
+            name: {'nodes': n, 'edges': e, 'density': d}
+            for name, n, e, d in zip(df['Instance'].tolist(), df['Nodes'].tolist(),
+                                     df['Edges'].tolist(), df['Density'].tolist())
+        }
     
     def list_instances(self, max_nodes: Optional[int] = None, 
                       min_nodes: Optional[int] = None) -> List[str]:
@@ -56,14 +169,15 @@ class APAInstanceManager:
         Returns:
             Lista de nomes de instâncias
         """
-        filtered_df = self.instances_df.copy()
-        
+        # Filtrar só a coluna de nomes; a tabela compartilhada não é copiada
+        nodes = self.instances_df['Nodes']
+        mask = np.ones(len(nodes), dtype=bool)
         if max_nodes is not None:
-            filtered_df = filtered_df[filtered_df['Nodes'] <= max_nodes]
+            mask &= (nodes <= max_nodes).to_numpy()
         if min_nodes is not None:
-            filtered_df = filtered_df[filtered_df['Nodes'] >= min_nodes]
+            mask &= (nodes >= min_nodes).to_numpy()
         
-        return filtered_df['Instance'].tolist()
+        return self.instances_df['Instance'][mask].tolist()
     
     def get_instance_info(self, instance_name: str) -> Dict:
         """
@@ -108,11 +222,15 @@ class APAInstanceManager:
             logger.info(f"Arquivo {instance_name}.clq já existe")
             return True
         
+        # Import tardio: requests só é necessário quando há download
+        import requests
+        
         try:
             logger.info(f"Baixando {instance_name} de {url}")
             response = requests.get(url, timeout=30)
             response.raise_for_status()
             
+            self.data_dir.mkdir(exist_ok=True)
             with open(file_path, 'w') as f:
                 f.write(response.text)
             
@@ -132,7 +250,7 @@ class APAInstanceManager:
             auto_download: Baixar automaticamente se não existir
             
         Returns:
-            Grafo NetworkX
+            Grafo NetworkX congelado (compartilhado entre chamadas)
         """
         file_path = self.data_dir / f"{instance_name}.clq"
         
@@ -142,7 +260,7 @@ class APAInstanceManager:
             else:
                 raise FileNotFoundError(f"Arquivo {instance_name}.clq não encontrado")
         
-        return self._parse_dimacs_file(file_path)
+        return _load_dimacs_graph(str(file_path), file_path.stat().st_mtime_ns)
     
     def load_instance(self, instance_name: str) -> Optional[nx.Graph]:
         """
@@ -152,7 +270,7 @@ class APAInstanceManager:
             instance_name: Nome da instância (ex: 'C125.9')
             
         Returns:
-            Grafo NetworkX ou None se erro
+            Grafo NetworkX congelado ou None se erro
         """
         if instance_name not in self.instances_info:
             logger.error(f"Instância {instance_name} não está na lista da atividade APA")
@@ -167,14 +285,15 @@ class APAInstanceManager:
                 logger.error(f"Falha ao baixar {instance_name}")
                 return None
         
-        # Carregar grafo
+        # Carregar grafo (reaproveitado se já lido nesta sessão)
         try:
-            return self._parse_dimacs_file(file_path)
+            return _load_dimacs_graph(str(file_path), file_path.stat().st_mtime_ns)
         except Exception as e:
             logger.error(f"Erro ao carregar {instance_name}: {e}")
             return None
     
-    def _parse_dimacs_file(self, file_path: Path) -> nx.Graph:
+    @staticmethod
+    def _parse_dimacs_file(file_path: Path) -> nx.Graph:
         """
         Parsear arquivo DIMACS e criar grafo NetworkX.
         
@@ -208,51 +327,15 @@ class APAInstanceManager:
         """
         Obter estatísticas das instâncias APA.
         
+        Densidade, categoria de tamanho e família são calculadas na leitura
+        do CSV; aqui só se faz a cópia, uma vez por gerenciador.
+        
         Returns:
-            DataFrame com estatísticas
+            DataFrame com estatísticas (compartilhado; não modificar in-place)
         """
-        stats_df = self.instances_df.copy()
-        
-        # Adicionar densidade
-        stats_df['Density'] = (2 * stats_df['Edges']) / (stats_df['Nodes'] * (stats_df['Nodes'] - 1))
-        
-        # Adicionar categoria de tamanho
-        def categorize_size(nodes):
-            if nodes <= 200:
-                return 'Pequeno'
-            elif nodes <= 500:
-                return 'Médio'
-            elif nodes <= 1000:
-                return 'Grande'
-            else:
-                return 'Muito Grande'
-        
-        stats_df['Size_Category'] = stats_df['Nodes'].apply(categorize_size)
-        
-        # Adicionar família
-        def get_family(instance):
-            if instance.startswith('C'):
-                return 'C-family'
-            elif instance.startswith('DSJC'):
-                return 'DSJC'
-            elif instance.startswith('MANN'):
-                return 'MANN'
-            elif instance.startswith('brock'):
-                return 'brock'
-            elif instance.startswith('gen'):
-                return 'gen'
-            elif instance.startswith('hamming'):
-                return 'hamming'
-            elif instance.startswith('keller'):
-                return 'keller'
-            elif instance.startswith('p_hat'):
-                return 'p_hat'
-            else:
-                return 'other'
-        
-        stats_df['Family'] = stats_df['Instance'].apply(get_family)
-        
-        return stats_df
+        if self._statistics is None:
+            self._statistics = self.instances_df.copy()
+        return self._statistics
     
     def download_all_instances(self, max_nodes: Optional[int] = None, 
                               force: bool = False) -> List[str]:
@@ -316,9 +399,9 @@ class APAInstanceManager:
         
         print("Top 5 maiores instâncias:")
         top5 = stats_df.nlargest(5, 'Nodes')[['Instance', 'Nodes', 'Edges', 'Density']]
-        for _, row in top5.iterrows():
-            print(f"  {row['Instance']}: {row['Nodes']} nós, {row['Edges']:,} arestas, "
-                  f"densidade {row['Density']:.3f}")
+        for instance, nodes, edges, density in top5.itertuples(index=False, name=None):
+            print(f"  {instance}: {nodes} nós, {edges:,} arestas, "
+                  f"densidade {density:.3f}")
     
     def get_apa_instance_list(self) -> List[str]:
         """
@@ -339,48 +422,27 @@ class APAInstanceManager:
         Returns:
             Tamanho do clique ótimo conhecido ou None se não conhecido
         """
-        # Valores ótimos conhecidos das instâncias DIMACS
-        known_optima = {
-            'C125.9': 34,
-            'C250.9': 44, 
-            'C500.9': 57,
-            'C1000.9': 68,
-            'C2000.9': 80,
-            'C2000.5': 16,
-            'C4000.5': 18,
-            'DSJC500_5': 13,
-            'DSJC1000_5': 15,
-            'MANN_a27': 126,
-            'MANN_a45': 345,
-            'MANN_a81': 1100,
-            'brock200_2': 12,
-            'brock200_4': 17,
-            'brock400_2': 29,
-            'brock400_4': 33,
-            'brock800_2': 24,
-            'brock800_4': 26,
-            'gen200_p0.9_44': 44,
-            'gen200_p0.9_55': 55,
-            'gen400_p0.9_55': 55,
-            'gen400_p0.9_65': 65,
-            'gen400_p0.9_75': 75,
-            'hamming8-4': 16,
-            'hamming10-4': 40,
-            'keller4': 11,
-            'keller5': 27,
-            'keller6': 59,
-            'p_hat300-1': 8,
-            'p_hat300-2': 25,
-            'p_hat300-3': 36,
-            'p_hat700-1': 11,
-            'p_hat700-2': 44,
-            'p_hat700-3': 62,
-            'p_hat1500-1': 12,
-            'p_hat1500-2': 65,
-            'p_hat1500-3': 94
-        }
-        
-        return known_optima.get(instance_name)
+        return KNOWN_OPTIMA.get(instance_name)
+
+
+@lru_cache(maxsize=GRAPH_CACHE_SIZE)
+def _load_dimacs_graph(path: str, mtime_ns: int) -> nx.Graph:
+    """
+    Ler um arquivo DIMACS uma vez por sessão.
+    
+    A chave inclui o mtime, então um arquivo baixado de novo é relido. O
+    grafo é congelado porque a mesma instância é entregue a todos os
+    chamadores (CliSAT e heurística da mesma instância, reexecuções).
+    
+    Args:
+        path: Caminho do arquivo .clq
+        mtime_ns: Data de modificação do arquivo (parte da chave do cache)
+        
+    Returns:
+        Grafo NetworkX congelado
+    """
+    return nx.freeze(APAInstanceManager._parse_dimacs_file(Path(path)))
+
 
 def main():
     """Função principal para demonstração."""
@@ -20,11 +20,14 @@ FORMATO DA TABELA DE RESULTADOS:
 - Quality: Razão heuristic_size/exact_size (qualidade da heurística)
 """
 
+import json
+import numpy as np
 import pandas as pd
 import networkx as nx
 import time
 import os
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Tuple, Optional
 import logging
 
 import sys
@@ -40,22 +43,33 @@ from data.instance_manager import APAInstanceManager
 
 logger = logging.getLogger(__name__)
 
+# Colunas inteiras da tabela de resultados
+INTEGER_COLUMNS = ('Nodes', 'Edges', 'Exact_Size', 'Heuristic_Size')
+
 
 class APAResultsGenerator:
     """
     Classe para executar experimentos e gerar resultados da atividade APA.
     """
     
-    def __init__(self, data_dir: str = "dimacs_data", results_dir: str = "benchmark_results"):
+    # Aquecimento só compensa em instâncias pequenas, onde o custo fixo pesa
+    WARMUP_MAX_NODES = 500
+    WARMUP_TIME_LIMIT = 0.01
+    
+    def __init__(self, data_dir: str = "dimacs_data", results_dir: str = "benchmark_results",
+                 warmup: bool = False):
         """
         Inicializar gerador de resultados.
         
         Args:
             data_dir: Diretório onde estão os arquivos DIMACS
             results_dir: Diretório para salvar os resultados
+            warmup: Executar o CliSAT uma vez, descartando o resultado, antes da
+                medição em instâncias com menos de WARMUP_MAX_NODES vértices
         """
         self.data_dir = data_dir
         self.results_dir = results_dir
+        self.warmup = warmup
         self.instance_manager = APAInstanceManager(data_dir)
         
         # Criar diretório de resultados se não existir
@@ -84,17 +98,17 @@ class APAResultsGenerator:
         Returns:
             Dicionário com resultados da execução
         """
-        logger.info(f"Processando instância: {instance_name}")
+        logger.info("Processando instância: %s", instance_name)
         
         # Carregar grafo
         try:
             graph = self.instance_manager.load_instance(instance_name)
             if graph is None:
-                logger.error(f"Não foi possível carregar a instância {instance_name}")
+                logger.error("Não foi possível carregar a instância %s", instance_name)
                 return None
                 
         except Exception as e:
-            logger.error(f"Erro ao carregar {instance_name}: {e}")
+            logger.error("Erro ao carregar %s: %s", instance_name, e)
             return None
         
         result = {
@@ -103,36 +117,48 @@ class APAResultsGenerator:
             'Edges': len(graph.edges()),
         }
         
-        logger.info(f"  Grafo: {result['Nodes']} vértices, {result['Edges']} arestas")
+        logger.info("  Grafo: %d vértices, %d arestas", result['Nodes'], result['Edges'])
         
         # Executar algoritmo exato (CliSAT)
         logger.info("  Executando algoritmo exato (CliSAT)...")
+        if self.warmup and result['Nodes'] < self.WARMUP_MAX_NODES:
+            # Carregar kernels Numba e estruturas do processo fora da medição
+            warmup_ns = time.perf_counter_ns()
+            try:
+                solve_maximum_clique_clisat(graph, time_limit=self.WARMUP_TIME_LIMIT)
+            except Exception as e:
+                logger.warning("    Falha no aquecimento: %s", e)
+            result['Warmup_Time'] = round((time.perf_counter_ns() - warmup_ns) / 1e9, 3)
+        
         try:
-            start_time = time.time()
+            # Relógio monotônico em ns: imune a ajustes do relógio do sistema
+            start_ns = time.perf_counter_ns()
             exact_clique, exact_size, exact_stats = solve_maximum_clique_clisat(graph, time_limit=time_limit_exact)
-            exact_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            exact_time = elapsed_ns / 1e9
             
             result['Exact_Size'] = exact_size
             result['Exact_Time'] = round(exact_time, 3)
+            result['Exact_Time_ns'] = elapsed_ns
             result['Exact_Status'] = 'COMPLETED'
             
-            logger.info(f"    Clique exato: tamanho {exact_size}, tempo {exact_time:.3f}s")
+            logger.info("    Clique exato: tamanho %d, tempo %.3fs", exact_size, exact_time)
             
         except Exception as e:
-            logger.error(f"    Erro no algoritmo exato: {e}")
+            logger.error("    Erro no algoritmo exato: %s", e)
             result['Exact_Size'] = 0
             result['Exact_Time'] = time_limit_exact
+            result['Exact_Time_ns'] = int(time_limit_exact * 1e9)
             result['Exact_Status'] = 'ERROR'
         
         # Executar heurística gulosa
         logger.info("  Executando heurística gulosa...")
         try:
-            start_time = time.time()
             heur_clique, heur_size, heur_time = solve_maximum_clique_heuristic(graph)
             
             # Limitar tempo se necessário
             if heur_time > time_limit_heuristic:
-                logger.warning(f"    Heurística excedeu tempo limite: {heur_time:.3f}s")
+                logger.warning("    Heurística excedeu tempo limite: %.3fs", heur_time)
                 result['Heuristic_Status'] = 'TIMEOUT'
             else:
                 result['Heuristic_Status'] = 'COMPLETED'
@@ -140,10 +166,10 @@ class APAResultsGenerator:
             result['Heuristic_Size'] = heur_size
             result['Heuristic_Time'] = round(heur_time, 6)
             
-            logger.info(f"    Clique heurístico: tamanho {heur_size}, tempo {heur_time:.6f}s")
+            logger.info("    Clique heurístico: tamanho %d, tempo %.6fs", heur_size, heur_time)
             
         except Exception as e:
-            logger.error(f"    Erro na heurística: {e}")
+            logger.error("    Erro na heurística: %s", e)
             result['Heuristic_Size'] = 0
             result['Heuristic_Time'] = 0
             result['Heuristic_Status'] = 'ERROR'
@@ -160,14 +186,15 @@ class APAResultsGenerator:
         else:
             result['Speedup'] = float('inf')
         
-        logger.info(f"    Qualidade: {result['Quality']:.3f}, Speedup: {result['Speedup']}x")
-        logger.info(f"  Instância {instance_name} concluída")
+        logger.info("    Qualidade: %.3f, Speedup: %sx", result['Quality'], result['Speedup'])
+        logger.info("  Instância %s concluída", instance_name)
         
         return result
     
     def run_all_instances(self, instances: List[str] = None, 
                          time_limit_exact: int = 1800,
-                         time_limit_heuristic: int = 60) -> pd.DataFrame:
+                         time_limit_heuristic: int = 60,
+                         n_workers: int = 1) -> pd.DataFrame:
         """
         Executar algoritmos em todas as instâncias especificadas.
         
@@ -175,46 +202,95 @@ class APAResultsGenerator:
             instances: Lista de instâncias para testar (None = todas da atividade)
             time_limit_exact: Tempo limite para algoritmo exato
             time_limit_heuristic: Tempo limite para heurística
+            n_workers: Processos executando instâncias em paralelo (1 = sequencial)
             
         Returns:
-            DataFrame com todos os resultados
+            DataFrame com todos os resultados, na ordem de `instances`
         """
         if instances is None:
             instances = self.instance_manager.get_apa_instance_list()
         
-        logger.info(f"Iniciando experimentos com {len(instances)} instâncias")
-        logger.info(f"Tempo limite exato: {time_limit_exact}s, heurística: {time_limit_heuristic}s")
+        logger.info("Iniciando experimentos com %d instâncias", len(instances))
+        logger.info("Tempo limite exato: %ss, heurística: %ss", time_limit_exact, time_limit_heuristic)
         
         results = []
         completed = 0
         total = len(instances)
         
-        for instance_name in instances:
-            logger.info(f"\n[{completed + 1}/{total}] Processando {instance_name}")
-            
-            result = self.run_single_instance(
-                instance_name, 
-                time_limit_exact=time_limit_exact,
-                time_limit_heuristic=time_limit_heuristic
-            )
-            
-            if result:
-                results.append(result)
-                completed += 1
-                
-                # Salvar resultados parciais a cada 5 instâncias
-                if completed % 5 == 0:
-                    partial_df = pd.DataFrame(results)
-                    partial_df.to_csv(f'{self.results_dir}/partial_results_{completed}.csv', index=False)
-                    logger.info(f"Resultados parciais salvos: {completed} instâncias")
+        if n_workers > 1:
+            outcomes = self._iter_parallel(instances, time_limit_exact,
+                                           time_limit_heuristic, n_workers)
+        else:
+            outcomes = self._iter_sequential(instances, time_limit_exact,
+                                             time_limit_heuristic)
+        
+        # Resultados parciais: uma linha JSON por instância, gravada assim que
+        # ela termina (uma interrupção perde no máximo a instância em curso)
+        partial_file = os.path.join(self.results_dir, 'partial_results.jsonl')
+        with open(partial_file, 'w', buffering=1) as partial:
+            for result in outcomes:
+                if result:
+                    results.append(result)
+                    completed += 1
+                    partial.write(json.dumps(result, separators=(',', ':'),
+                                             default=_json_default) + '\n')
+        
+        logger.info("Resultados parciais salvos em: %s (%d bytes)",
+                    partial_file, os.path.getsize(partial_file))
+        
+        # Em paralelo os resultados chegam na ordem de conclusão
+        if n_workers > 1:
+            position = {name: i for i, name in enumerate(instances)}
+            results.sort(key=lambda r: position[r['Instance']])
         
         # Criar DataFrame final
         results_df = pd.DataFrame(results)
         
-        logger.info(f"\nExperimentos concluídos: {completed}/{total} instâncias")
+        # Contagens cabem em int32 (ou menos); tempos e razões ficam em float64
+        # para não alterar as estatísticas reportadas
+        for col in INTEGER_COLUMNS:
+            if col in results_df:
+                results_df[col] = pd.to_numeric(results_df[col], downcast='integer')
+        
+        logger.info("\nExperimentos concluídos: %d/%d instâncias", completed, total)
         
         return results_df
     
+    def _iter_sequential(self, instances: List[str], time_limit_exact: int,
+                         time_limit_heuristic: int) -> Iterator[Optional[Dict]]:
+        """Executar as instâncias uma a uma, no processo atual."""
+        total = len(instances)
+        for i, instance_name in enumerate(instances, 1):
+            logger.info("\n[%d/%d] Processando %s", i, total, instance_name)
+            yield self.run_single_instance(
+                instance_name, 
+                time_limit_exact=time_limit_exact,
+                time_limit_heuristic=time_limit_heuristic
+            )
+    
+    def _iter_parallel(self, instances: List[str], time_limit_exact: int,
+                       time_limit_heuristic: int, n_workers: int) -> Iterator[Optional[Dict]]:
+        """
+        Executar as instâncias em processos separados.
+        
+        Cada solver ocupa um núcleo por até time_limit_exact segundos; as
+        instâncias são independentes, então cada uma vira uma tarefa. Só o
+        processo principal grava arquivos de resultados.
+        
+        Yields:
+            Resultado de cada instância, na ordem de conclusão
+        """
+        total = len(instances)
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_results_worker,
+                                 initargs=(self,)) as pool:
+            futures = {pool.submit(_run_instance, name, time_limit_exact,
+                                   time_limit_heuristic): name
+                       for name in instances}
+            for done, future in enumerate(as_completed(futures), 1):
+                logger.info("[%d/%d] %s concluída", done, total, futures[future])
+                yield future.result()
+    
     def generate_summary_statistics(self, results_df: pd.DataFrame) -> Dict:
         """
         Gerar estatísticas resumidas dos resultados.
@@ -227,40 +303,49 @@ class APAResultsGenerator:
         """
         stats = {}
         
+        # Máscaras de status calculadas uma vez e reaproveitadas
+        exact_ok = (results_df['Exact_Status'] == 'COMPLETED').to_numpy()
+        heuristic_ok = (results_df['Heuristic_Status'] == 'COMPLETED').to_numpy()
+        
         # Estatísticas gerais
         stats['total_instances'] = len(results_df)
-        stats['exact_completed'] = sum(results_df['Exact_Status'] == 'COMPLETED')
-        stats['heuristic_completed'] = sum(results_df['Heuristic_Status'] == 'COMPLETED')
+        stats['exact_completed'] = int(exact_ok.sum())
+        stats['heuristic_completed'] = int(heuristic_ok.sum())
         
         # Estatísticas de tempo
-        exact_times = results_df[results_df['Exact_Status'] == 'COMPLETED']['Exact_Time']
-        heuristic_times = results_df[results_df['Heuristic_Status'] == 'COMPLETED']['Heuristic_Time']
+        exact_times = results_df['Exact_Time'][exact_ok]
+        heuristic_times = results_df['Heuristic_Time'][heuristic_ok]
         
+        # Cada coluna é reduzida em uma única chamada agg
         if not exact_times.empty:
-            stats['exact_time_mean'] = round(exact_times.mean(), 3)
-            stats['exact_time_median'] = round(exact_times.median(), 3)
-            stats['exact_time_max'] = round(exact_times.max(), 3)
+            t = exact_times.agg(['mean', 'median', 'max'])
+            stats['exact_time_mean'] = round(t['mean'], 3)
+            stats['exact_time_median'] = round(t['median'], 3)
+            stats['exact_time_max'] = round(t['max'], 3)
         
         if not heuristic_times.empty:
-            stats['heuristic_time_mean'] = round(heuristic_times.mean(), 6)
-            stats['heuristic_time_median'] = round(heuristic_times.median(), 6)
-            stats['heuristic_time_max'] = round(heuristic_times.max(), 6)
+            t = heuristic_times.agg(['mean', 'median', 'max'])
+            stats['heuristic_time_mean'] = round(t['mean'], 6)
+            stats['heuristic_time_median'] = round(t['median'], 6)
+            stats['heuristic_time_max'] = round(t['max'], 6)
         
         # Estatísticas de qualidade
         qualities = results_df[results_df['Quality'] > 0]['Quality']
         if not qualities.empty:
-            stats['quality_mean'] = round(qualities.mean(), 3)
-            stats['quality_median'] = round(qualities.median(), 3)
-            stats['quality_min'] = round(qualities.min(), 3)
-            stats['quality_max'] = round(qualities.max(), 3)
-            stats['perfect_solutions'] = sum(qualities == 1.0)
+            q = qualities.agg(['mean', 'median', 'min', 'max'])
+            stats['quality_mean'] = round(q['mean'], 3)
+            stats['quality_median'] = round(q['median'], 3)
+            stats['quality_min'] = round(q['min'], 3)
+            stats['quality_max'] = round(q['max'], 3)
+            stats['perfect_solutions'] = int((qualities == 1.0).sum())
         
         # Estatísticas de speedup
         speedups = results_df[results_df['Speedup'] != float('inf')]['Speedup']
         if not speedups.empty:
-            stats['speedup_mean'] = round(speedups.mean(), 1)
-            stats['speedup_median'] = round(speedups.median(), 1)
-            stats['speedup_max'] = round(speedups.max(), 1)
+            sp = speedups.agg(['mean', 'median', 'max'])
+            stats['speedup_mean'] = round(sp['mean'], 1)
+            stats['speedup_median'] = round(sp['median'], 1)
+            stats['speedup_max'] = round(sp['max'], 1)
         
         return stats
     
@@ -279,7 +364,7 @@ class APAResultsGenerator:
         
         # Salvar CSV principal
         results_df_sorted.to_csv(filepath, index=False)
-        logger.info(f"Resultados salvos em: {filepath}")
+        logger.info("Resultados salvos em: %s (%d bytes)", filepath, os.path.getsize(filepath))
         
         # Gerar arquivo formatado para apresentação
         presentation_cols = [
@@ -290,14 +375,15 @@ class APAResultsGenerator:
         if all(col in results_df_sorted.columns for col in presentation_cols):
             presentation_df = results_df_sorted[presentation_cols].copy()
             
-            # Formatar para apresentação
-            presentation_df['Exact_Time'] = presentation_df['Exact_Time'].apply(lambda x: f"{x:.3f}")
-            presentation_df['Heuristic_Time'] = presentation_df['Heuristic_Time'].apply(lambda x: f"{x:.6f}")
-            presentation_df['Quality'] = presentation_df['Quality'].apply(lambda x: f"{x:.3f}")
+            # Formatar para apresentação (format ligado direto, sem lambda por célula)
+            presentation_df['Exact_Time'] = presentation_df['Exact_Time'].map('{:.3f}'.format)
+            presentation_df['Heuristic_Time'] = presentation_df['Heuristic_Time'].map('{:.6f}'.format)
+            presentation_df['Quality'] = presentation_df['Quality'].map('{:.3f}'.format)
             
             presentation_file = filepath.replace('.csv', '_presentation.csv')
             presentation_df.to_csv(presentation_file, index=False)
-            logger.info(f"Tabela para apresentação salva em: {presentation_file}")
+            logger.info("Tabela para apresentação salva em: %s (%d bytes)",
+                        presentation_file, os.path.getsize(presentation_file))
         
         # Gerar estatísticas resumidas
         stats = self.generate_summary_statistics(results_df_sorted)
@@ -340,14 +426,56 @@ class APAResultsGenerator:
                 f.write(f"Speedup mediano: {stats['speedup_median']}x\n")
                 f.write(f"Speedup máximo: {stats['speedup_max']}x\n")
         
-        logger.info(f"Resumo estatístico salvo em: {stats_file}")
+        logger.info("Resumo estatístico salvo em: %s (%d bytes)",
+                    stats_file, os.path.getsize(stats_file))
+
+
+def _json_default(obj):
+    """Converter escalares NumPy (e demais tipos) para JSON."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def load_partial_results(partial_file: str) -> pd.DataFrame:
+    """
+    Carregar os resultados parciais gravados por run_all_instances.
+    
+    Args:
+        partial_file: Caminho do arquivo partial_results.jsonl
+        
+    Returns:
+        DataFrame com uma linha por instância concluída
+    """
+    return pd.read_json(partial_file, lines=True)
+
+
+# Gerador usado pelos processos worker de run_all_instances
+_WORKER_GENERATOR: Optional[APAResultsGenerator] = None
+
+
+def _init_results_worker(generator: APAResultsGenerator) -> None:
+    """Inicializar o gerador local de um processo worker."""
+    global _WORKER_GENERATOR
+    _WORKER_GENERATOR = generator
+
+
+def _run_instance(instance_name: str, time_limit_exact: int,
+                  time_limit_heuristic: int) -> Optional[Dict]:
+    """Executar uma instância em um processo worker."""
+    return _WORKER_GENERATOR.run_single_instance(
+        instance_name,
+        time_limit_exact=time_limit_exact,
+        time_limit_heuristic=time_limit_heuristic
+    )
 
 
 # Função principal para executar os experimentos
 def run_apa_experiments(instances: List[str] = None, 
                        time_limit_exact: int = 1800,
                        time_limit_heuristic: int = 60,
-                       save_file: str = "apa_results.csv") -> pd.DataFrame:
+                       save_file: str = "apa_results.csv",
+                       n_workers: int = 1) -> pd.DataFrame:
     """
     Função principal para executar todos os experimentos da atividade APA.
     
@@ -356,6 +484,7 @@ def run_apa_experiments(instances: List[str] = None,
         time_limit_exact: Tempo limite para algoritmo exato (segundos)
         time_limit_heuristic: Tempo limite para heurística (segundos)
         save_file: Nome do arquivo para salvar os resultados
+        n_workers: Processos executando instâncias em paralelo (1 = sequencial)
         
     Returns:
         DataFrame com os resultados
@@ -366,7 +495,8 @@ def run_apa_experiments(instances: List[str] = None,
     results_df = generator.run_all_instances(
         instances=instances,
         time_limit_exact=time_limit_exact,
-        time_limit_heuristic=time_limit_heuristic
+        time_limit_heuristic=time_limit_heuristic,
+        n_workers=n_workers
     )
     
     # Salvar resultados
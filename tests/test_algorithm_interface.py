@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Testes da interface comum dos algoritmos (AlgorithmInterface).
+"""
+
+import sys
+from pathlib import Path
+import networkx as nx
+
+# Adicionar raiz do projeto ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from algorithms.algorithm_interface import AlgorithmInterface, AlgorithmResult
+
+
+class _DummyAlgorithm(AlgorithmInterface):
+    """Implementação mínima para exercitar os métodos da interface."""
+
+    def solve(self) -> AlgorithmResult:
+        return AlgorithmResult(clique=[], clique_size=0, execution_time=0.0,
+                               algorithm_name=self.algorithm_name)
+
+    @property
+    def algorithm_name(self) -> str:
+        return "dummy"
+
+    @property
+    def is_exact(self) -> bool:
+        return False
+
+
+def _create_test_graph() -> nx.Graph:
+    """K5 (vértices 1..5) + vértices extras parcialmente conectados."""
+    G = nx.complete_graph(range(1, 6))
+    G.add_edges_from([(6, 1), (6, 2), (7, 3)])
+    return G
+
+
+def test_validate_clique():
+    """Validação de cliques válidos e inválidos."""
+    algorithm = _DummyAlgorithm(_create_test_graph())
+
+    assert algorithm.validate_clique([])
+    assert algorithm.validate_clique([1])
+    assert algorithm.validate_clique([1, 2, 3, 4, 5])
+    assert algorithm.validate_clique([6, 1, 2])
+    assert not algorithm.validate_clique([6, 1, 3])
+    assert not algorithm.validate_clique([1, 2, 99])
+    assert not algorithm.validate_clique([1, 1, 2])
+
+
+def test_get_graph_info():
+    """Informações do grafo e reaproveitamento das métricas caras."""
+    algorithm = _DummyAlgorithm(_create_test_graph())
+
+    info = algorithm.get_graph_info()
+    assert info['nodes'] == 7
+    assert info['edges'] == 13
+    assert info['is_connected']
+    assert 'diameter' not in info
+
+    info = algorithm.get_graph_info(include_expensive=True)
+    assert info['diameter'] == 3
+    assert algorithm.get_graph_info(include_expensive=True) == info
+
+
+def test_neighbors():
+    """Vizinhanças como fatias do arranjo CSR."""
+    algorithm = _DummyAlgorithm(_create_test_graph())
+
+    idx = algorithm._node_index
+    assert sorted(algorithm.neighbors(idx[6]).tolist()) == sorted([idx[1], idx[2]])
+    assert algorithm.neighbors(idx[7]).tolist() == [idx[3]]
+
+
+def test_result_rejects_inconsistent_size():
+    """Tamanho inconsistente do clique é rejeitado em vez de corrigido."""
+    result = AlgorithmResult(clique=[3, 1, 2], clique_size=3, execution_time=0.0,
+                             algorithm_name="dummy")
+    assert result.clique_list == [1, 2, 3]
+
+    try:
+        AlgorithmResult(clique=[1, 2], clique_size=3, execution_time=0.0,
+                        algorithm_name="dummy")
+    except ValueError:
+        pass
+    else:
+        assert False, "clique_size inconsistente deveria falhar"
+
+
+def test_graph_data_shared_between_instances():
+    """Instâncias sobre o mesmo grafo reaproveitam as estruturas indexadas."""
+    G = _create_test_graph()
+    first = _DummyAlgorithm(G)
+    second = _DummyAlgorithm(G)
+    assert second._adj_bits is first._adj_bits
+
+    # Grafo alterado: estruturas recalculadas
+    G.add_edge(6, 3)
+    third = _DummyAlgorithm(G)
+    assert third._adj_bits is not first._adj_bits
+    assert third.validate_clique([1, 2, 3, 6])
+
+
+def test_graph_data_refreshed_after_edge_swap():
+    """Troca de arestas com as mesmas contagens não reaproveita estruturas antigas."""
+    G = _create_test_graph()
+    first = _DummyAlgorithm(G)
+    assert first.validate_clique([1, 2, 3])
+
+    G.remove_edge(1, 2)
+    G.add_edge(7, 4)
+    second = _DummyAlgorithm(G)
+    assert second._adj_bits is not first._adj_bits
+    assert not second.validate_clique([1, 2, 3])
+    assert second.validate_clique([3, 4, 7])
+
+
+def test_can_extend():
+    """Extensão incremental de cliques com máscaras de bits."""
+    algorithm = _DummyAlgorithm(_create_test_graph())
+
+    assert algorithm.can_extend([1, 2], 6)
+    assert not algorithm.can_extend([1, 3], 6)
+    assert not algorithm.can_extend([1, 2], 1)
+    assert not algorithm.can_extend([1, 2], 99)
+
+    mask = algorithm.clique_mask([1, 2, 3])
+    assert algorithm.can_extend(mask, 4)
+    assert not algorithm.can_extend(mask, 7)
+
+
+def test_result_quick():
+    """Construção rápida de resultados intermediários."""
+    result = AlgorithmResult.quick([3, 1, 2], "dummy", 0.5, iterations=4)
+    assert result.clique_list == [1, 2, 3]
+    assert result.clique_size == 3
+    assert result.iterations == 4
+    assert not result.is_optimal
+    assert dict(result.additional_info) == {}
+
+
+def test_result_keeps_non_int32_labels():
+    """Rótulos fora de int32 são mantidos como lista, sem conversão."""
+    for clique in (['b', 'a'], [2**40, 1], [1.5]):
+        result = AlgorithmResult(clique=clique, clique_size=len(clique),
+                                 execution_time=0.0, algorithm_name="dummy")
+        assert result.clique_list == clique
+        assert AlgorithmResult.quick(clique, "dummy", 0.0).clique_list == clique
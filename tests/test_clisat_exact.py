@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Testes de exatidão do CliSAT em grafos aleatórios pequenos.
+"""
+
+import sys
+from pathlib import Path
+import networkx as nx
+
+# Adicionar raiz do projeto ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from algorithms.clisat_exact import CliSAT
+
+
+# (n, p, seed) de gnp_random_graph; os quatro primeiros já fizeram o
+# CliSAT devolver um clique menor que o máximo
+GRAPH_CASES = [
+    (44, 0.7, 5),
+    (36, 0.7, 133),
+    (53, 0.9, 152),
+    (59, 0.5, 179),
+    (9, 0.5, 18),
+    (16, 0.7, 439),
+    (30, 0.3, 551),
+    (33, 0.5, 36),
+    (42, 0.9, 805),
+    (50, 0.8, 303),
+]
+
+
+def _check_exact(n_workers: int):
+    """Compara o CliSAT com o clique máximo obtido por enumeração."""
+    for n, p, seed in GRAPH_CASES:
+        G = nx.gnp_random_graph(n, p, seed=seed)
+        expected = max(len(c) for c in nx.find_cliques(G))
+
+        clique, size = CliSAT(G, n_workers=n_workers).solve()
+
+        assert size == len(clique) == len(set(clique)), (n, p, seed)
+        assert all(G.has_edge(u, v) for i, u in enumerate(clique) for v in clique[i + 1:]), \
+            (n, p, seed)
+        assert size == expected, (n, p, seed, size, expected)
+
+
+def test_clisat_exact_sequential():
+    """Execução sequencial encontra o clique máximo."""
+    _check_exact(n_workers=1)
+
+
+def test_clisat_exact_parallel():
+    """Execução com vários processos na raiz encontra o clique máximo."""
+    _check_exact(n_workers=2)